@@ -17,6 +17,7 @@ Flags:
 """
 
 import os
+import re
 import sys
 try:
     import tomllib
@@ -42,14 +43,38 @@ import termios
 import tty
 import io
 import hashlib
+import heapq
+import mmap
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter, defaultdict
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from packaging import version
 from packaging import version as pkg_version
 import subprocess
-import urllib.request
-import urllib.error
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+try:
+    import ahocorasick  # Optional: single-pass package domain matching
+except ImportError:
+    ahocorasick = None
+
+# Parsed TOML per path for this invocation, keyed on (mtime_ns, size) so edits are picked up
+_toml_cache = {}
+
+def load_toml_cached(file_path) -> dict:
+    """Parse a TOML file at most once per invocation (reparsed if it changed on disk).
+
+    The returned dict is shared between callers - treat it as read-only.
+    """
+    path = os.fspath(file_path)
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _toml_cache.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    data = load_toml(path)
+    _toml_cache[path] = (key, data)
+    return data
 
 # ============================================================================
 # Logo and Version
@@ -79,7 +104,8 @@ def canonicalize_version(ver_str):
     Parse and canonicalize a version string.
 
     Returns a normalized packaging.version.Version object that treats
-    equivalent versions like 2.0 and 2.0.0 as equal.
+    equivalent versions like 2.0 and 2.0.0 as equal. String parses are
+    memoized (see _canonicalize_version_str); Version objects pass through.
 
     Args:
         ver_str: Version string (e.g., "2.0", "2.0.0", "1.0.0-rc1")
@@ -87,23 +113,85 @@ def canonicalize_version(ver_str):
     Returns:
         packaging.version.Version object or None if parsing fails
     """
-    if not ver_str or ver_str == 'path' or 'workspace' in str(ver_str):
+    if not ver_str:
+        return None
+    if isinstance(ver_str, pkg_version.Version):
+        return ver_str
+    # Cargo values are almost always str already; only coerce the odd int/float
+    if not isinstance(ver_str, str):
+        ver_str = str(ver_str)
+    return _canonicalize_version_str(ver_str)
+
+
+_VERSION_STRIP_CHARS = '" \t\r\n'
+# packaging's own PEP 440 grammar, compiled once, as a no-exception validity check
+PEP440_VERSION_RE = re.compile(r'^\s*' + pkg_version.VERSION_PATTERN + r'\s*$', re.VERBOSE | re.IGNORECASE)
+# Placeholder "versions" recorded for path/workspace dependencies
+NON_VERSION_SENTINELS = frozenset({'path', 'workspace'})
+
+def _clean_version_str(ver_str):
+    """Drop quotes/whitespace, keep the first token, then drop one leading '=' ('' if none)
+
+    A single leading 'v' is left to packaging, which accepts it natively;
+    stripping only one '=' keeps '==1.0', 'vv1.0' and 'v=1.0' invalid.
+    """
+    tokens = ver_str.strip(_VERSION_STRIP_CHARS).split()
+    if not tokens:
+        return ''
+    token = tokens[0]
+    return token[1:] if token.startswith('=') else token
+
+
+# Entries kept by the per-string parse caches (and by the intern table below)
+VERSION_CACHE_SIZE = 4096
+
+@lru_cache(maxsize=VERSION_CACHE_SIZE)
+def _canonicalize_version_str(ver_str):
+    """Cached worker for canonicalize_version (Version objects are immutable, so sharing is safe)"""
+    if ver_str in NON_VERSION_SENTINELS:
         return None
 
-    # Clean up version string
-    ver_str = str(ver_str).strip('"').split()[0]
+    ver_str = _clean_version_str(ver_str)
+    if not ver_str:
+        return None
 
-    # Handle leading '='
-    if ver_str.startswith('='):
-        ver_str = ver_str[1:]
+    # Reject non-versions (git refs, placeholders) without raising InvalidVersion
+    if not PEP440_VERSION_RE.match(ver_str):
+        return None
 
     try:
         # packaging.version.Version automatically normalizes versions
-        # so 2.0 and 2.0.0 become the same object
-        return pkg_version.parse(ver_str)
+        # so 2.0 and 2.0.0 compare and hash equal
+        parsed = pkg_version.parse(ver_str)
     except (pkg_version.InvalidVersion, ValueError):
         return None
-
+    # Spellings that normalize identically ("1.0", "=1.0", "\"1.0\"") share one object
+    key = str(parsed)
+    interned = _interned_versions.get(key)
+    if interned is None:
+        # Bounded like the LRU caches: start over rather than keep every Version alive
+        if len(_interned_versions) >= VERSION_CACHE_SIZE:
+            _interned_versions.clear()
+        interned = _interned_versions[key] = parsed
+    return interned
+
+# Normalized version string -> shared Version object. A plain dict: Version uses
+# __slots__ and can't be weakly referenced. Keyed on the normalized string rather
+# than the release tuple so "2.0" keeps printing as 2.0 and "2.0.0" as 2.0.0.
+_interned_versions = {}
+
+def _clear_version_caches():
+    _canonicalize_version_str.cache_clear()
+    _is_prerelease_str.cache_clear()
+    _interned_versions.clear()
+
+canonicalize_version.cache_clear = _clear_version_caches
+canonicalize_version.cache_info = _canonicalize_version_str.cache_info
+
+
+# Cheap pre-screen: every PEP 440 pre-release/dev spelling (a, b, c, rc, alpha,
+# beta, pre, preview, dev) contains one of these
+PRERELEASE_MARKER_RE = re.compile(r'[abc]|pre|dev', re.IGNORECASE)
 
 def is_prerelease(ver_obj):
     """
@@ -116,10 +204,7 @@ def is_prerelease(ver_obj):
         True if pre-release, False otherwise
     """
     if isinstance(ver_obj, str):
-        parsed = canonicalize_version(ver_obj)
-        if not parsed:
-            return False
-        ver_obj = parsed
+        return _is_prerelease_str(ver_obj)
 
     if ver_obj is None:
         return False
@@ -127,6 +212,16 @@ def is_prerelease(ver_obj):
     return ver_obj.is_prerelease
 
 
+@lru_cache(maxsize=VERSION_CACHE_SIZE)
+def _is_prerelease_str(ver_str):
+    """Cached pre-release flag per raw version string (computed once, like the parse)"""
+    # Without any PEP 440 pre/dev marker it can't be a pre-release - skip the parse
+    if not PRERELEASE_MARKER_RE.search(ver_str):
+        return False
+    parsed = canonicalize_version(ver_str)
+    return parsed.is_prerelease if parsed else False
+
+
 def filter_prerelease(versions):
     """
     Filter out pre-release versions from a list.
@@ -137,16 +232,32 @@ def filter_prerelease(versions):
     Returns:
         List of stable versions only
     """
-    stable = []
+    return list(_iter_stable_versions(versions))
+
+
+def canonicalize_versions(versions):
+    """
+    Canonicalize a batch of versions into parallel lists (structure-of-arrays).
+
+    Args:
+        versions: Iterable of version strings and/or packaging.version.Version objects
+
+    Returns:
+        Tuple (parsed, is_pre): parsed[i] is the Version or None if unparseable,
+        is_pre[i] is its pre-release flag (False when unparseable)
+    """
+    # canonicalize_version passes Version objects through and coerces anything else
+    parsed = [canonicalize_version(ver) for ver in versions]
+    is_pre = [bool(ver) and ver.is_prerelease for ver in parsed]
+    return parsed, is_pre
+
+
+def _iter_stable_versions(versions):
+    """Yield parsed stable versions lazily (shared by filter_prerelease/get_latest_stable)"""
     for ver in versions:
-        if isinstance(ver, str):
-            parsed = canonicalize_version(ver)
-            if parsed and not parsed.is_prerelease:
-                stable.append(parsed)
-        else:
-            if ver and not ver.is_prerelease:
-                stable.append(ver)
-    return stable
+        parsed = canonicalize_version(ver)
+        if parsed and not parsed.is_prerelease:
+            yield parsed
 
 
 def get_latest_stable(versions):
@@ -159,53 +270,58 @@ def get_latest_stable(versions):
     Returns:
         Latest stable version or None if no stable versions found
     """
-    stable = filter_prerelease(versions)
-    if not stable:
-        return None
-
-    # packaging.version.Version objects support comparison operators
-    return max(stable)
+    # Single pass: filter and track the max without building the stable list
+    return max(_iter_stable_versions(versions), default=None)
 
 
-def parse_version_metadata(ver_str):
+def top_n_stable(versions, n):
     """
-    Parse version metadata (e.g., v2.0.0-deprecated).
+    Get the N latest stable (non-prerelease) versions from a list.
 
     Args:
-        ver_str: Version string possibly with metadata
+        versions: List of packaging.version.Version objects or version strings
+        n: Number of versions to return
 
     Returns:
-        Dict with 'version' (Version object) and 'metadata' (string) keys
+        Up to n stable versions, newest first
     """
-    if not ver_str:
-        return {'version': None, 'metadata': None}
+    # Bounded heap: O(M log N) rather than sorting every stable version
+    return heapq.nlargest(n, _iter_stable_versions(versions))
 
-    ver_str = str(ver_str).strip()
 
-    # Handle leading 'v'
-    if ver_str.startswith('v'):
-        ver_str = ver_str[1:]
+def get_latest_stable_bulk(version_lists):
+    """
+    Get the latest stable version for each of many version lists.
 
-    # Check for metadata after hyphen (outside of pre-release markers)
-    # e.g., "2.0.0-deprecated" -> version="2.0.0", metadata="deprecated"
-    # BUT "2.0.0-rc1" -> this is a pre-release, not metadata
+    Args:
+        version_lists: Iterable of version lists (e.g. one per package)
 
-    try:
-        parsed = pkg_version.parse(ver_str)
+    Returns:
+        List with the latest stable version (or None) per input list
+    """
+    # Strings repeat heavily across packages; the parse caches are shared by every list
+    return [get_latest_stable(versions) for versions in version_lists]
 
-        # If there's a local version identifier, that's our metadata
-        if parsed.local:
-            return {
-                'version': parsed,
-                'metadata': parsed.local
-            }
 
-        return {
-            'version': parsed,
-            'metadata': None
-        }
-    except (pkg_version.InvalidVersion, ValueError):
-        return {'version': None, 'metadata': None}
+def parse_version_metadata(ver_str):
+    """
+    Parse version metadata (e.g., v2.0.0-deprecated).
+
+    Args:
+        ver_str: Version string possibly with metadata
+
+    Returns:
+        Dict with 'version' (Version object) and 'metadata' (string) keys
+    """
+    # Same cleanup and memoized parse as canonicalize_version (no second parse)
+    parsed = canonicalize_version(ver_str)
+
+    # A local version identifier ("2.0.0+deprecated") is our metadata;
+    # "2.0.0-rc1" is a pre-release, not metadata
+    return {
+        'version': parsed,
+        'metadata': (parsed.local or None) if parsed else None
+    }
 
 
 def versions_equal(ver1, ver2):
@@ -218,6 +334,12 @@ def versions_equal(ver1, ver2):
     Returns:
         True if versions are equal, False otherwise
     """
+    # Same object or identical strings are equal without parsing
+    if ver1 is ver2:
+        return True
+    if isinstance(ver1, str) and isinstance(ver2, str) and ver1 == ver2:
+        return True
+
     # Parse if strings
     if isinstance(ver1, str):
         parsed1 = canonicalize_version(ver1)
@@ -270,7 +392,8 @@ def get_version():
     return 'unknown'
 
 __version__ = get_version()
-from typing import List, Dict, Set, Optional, Tuple
+from typing import List, Dict, Set, Optional, Tuple, Iterator
+import shlex
 import shutil
 import tempfile
 
@@ -552,13 +675,9 @@ class ProgressSpinner:
                 sys.stdout.write(f'{progress_line}\n\r{spinner_line}')
                 first_iteration = False
             else:
-                # Move to start of line, clear both lines, then rewrite
-                sys.stdout.write('\033[1A')  # Move up to progress line
-                sys.stdout.write('\r')  # Move to start of line
-                sys.stdout.write('\033[K')  # Clear entire line
-                sys.stdout.write(f'{progress_line}\n\r')
-                sys.stdout.write('\033[K')  # Clear entire line
-                sys.stdout.write(f'{spinner_line}')
+                # Move up to progress line, clear and rewrite both lines in a
+                # single write so each frame costs one terminal syscall
+                sys.stdout.write(f'\033[1A\r\033[K{progress_line}\n\r\033[K{spinner_line}')
 
             sys.stdout.flush()
 
@@ -672,6 +791,7 @@ def get_version_risk(ver):
 
 def get_latest_version(package_name):
     """Get latest version from crates.io"""
+    import urllib.request  # Deferred: only network lookups pay its import cost
     try:
         url = f"https://crates.io/api/v1/crates/{package_name}"
         with urllib.request.urlopen(url, timeout=10) as response:
@@ -688,6 +808,7 @@ def get_latest_stable_version(package_name):
 
     Explicitly verifies returned version is not a pre-release.
     """
+    import urllib.request  # Deferred: only network lookups pay its import cost
     try:
         url = f"https://crates.io/api/v1/crates/{package_name}"
         with urllib.request.urlopen(url, timeout=10) as response:
@@ -756,6 +877,12 @@ def find_cargo_files(root_dir):
 
     return cargo_files
 
+@lru_cache(maxsize=1)
+def get_resolved_rust_root() -> Tuple[Path, str]:
+    """RUST_REPO_ROOT resolved once per run, as (Path, str) for prefix checks"""
+    rust_root = Path(RUST_REPO_ROOT).resolve()
+    return rust_root, str(rust_root)
+
 def get_relative_path(file_path):
     """Convert absolute path to relative path from RUST_REPO_ROOT"""
     if not RUST_REPO_ROOT:
@@ -763,10 +890,10 @@ def get_relative_path(file_path):
 
     try:
         abs_path = Path(file_path).resolve()
-        rust_root = Path(RUST_REPO_ROOT).resolve()
+        rust_root, rust_root_str = get_resolved_rust_root()
 
         # Check if file is under RUST_REPO_ROOT
-        if str(abs_path).startswith(str(rust_root)):
+        if str(abs_path).startswith(rust_root_str):
             rel_path = abs_path.relative_to(rust_root)
             return str(rel_path)
         else:
@@ -797,7 +924,7 @@ def analyze_dependencies():
 
     for cargo_path in cargo_files:
         try:
-            cargo_data = load_toml(cargo_path)
+            cargo_data = load_toml_cached(cargo_path)
 
             parent_repo = get_parent_repo(cargo_path)
 
@@ -956,11 +1083,8 @@ def format_version_analysis(dependencies):
     breaking_conflicts = 0
     breaking_updates = 0
     for dep_name, usages in sorted_deps:
-        versions = set()
-        for parent_repo, ver_str, dep_type, cargo_path in usages:
-            parsed_ver = parse_version(ver_str)
-            if parsed_ver:
-                versions.add(parsed_ver)
+        parsed, _ = canonicalize_versions([usage[1] for usage in usages])
+        versions = {ver for ver in parsed if ver}
 
         if versions:
             min_version = min(versions)
@@ -1085,11 +1209,8 @@ def detailed_review(dependencies):
 
     for dep_name, usages in sorted_deps:
         # Get versions used in ecosystem
-        versions = set()
-        for parent_repo, ver_str, dep_type, cargo_path in usages:
-            parsed_ver = parse_version(ver_str)
-            if parsed_ver:
-                versions.add(parsed_ver)
+        parsed, _ = canonicalize_versions([usage[1] for usage in usages])
+        versions = {ver for ver in parsed if ver}
 
         if not versions:
             continue
@@ -1506,9 +1627,13 @@ class RepoData:
     org: str = ""  # Organization/owner from path or metadata
     group: str = ""  # Group/category from path structure
     library_type: str = "project"  # "binary", "library", "workspace", "project"
+    hub_meta: Dict = field(default_factory=dict)  # [package.metadata.hub] table
 
 @dataclass
 class DepData:
+    # One instance per dependency row - slots drop the per-instance __dict__
+    # (explicit __slots__ since dataclass(slots=True) needs Python 3.10)
+    __slots__ = ('dep_id', 'repo_id', 'pkg_name', 'pkg_version', 'dep_type', 'features')
     dep_id: int
     repo_id: int
     pkg_name: str
@@ -1530,6 +1655,7 @@ class LatestData:
 
 @dataclass
 class VersionMapData:
+    __slots__ = ('map_id', 'dep_id', 'pkg_id', 'repo_id', 'version_state', 'breaking_type', 'ecosystem_status')
     map_id: int
     dep_id: int
     pkg_id: int
@@ -1547,34 +1673,39 @@ class HubInfo:
     last_update: int
 
 # Helper functions for data cache generation
+# Directory names pruned during Cargo.toml discovery (matched exactly, like find -path '*/name/*')
+CARGO_SCAN_EXCLUDED_DIRS = frozenset({
+    'target', 'ref', 'howto', '_arch', 'archive', 'bak', 'dev', '.git', 'node_modules'
+})
+
+def iter_cargo_files(root_dir) -> Iterator[Path]:
+    """Yield Cargo.toml paths under root_dir using an iterative os.scandir walk.
+
+    Excluded directories are pruned by name straight from the dirent, so
+    nothing beneath them is ever listed or stat'ed. Symlinked directories
+    are not followed.
+    """
+    stack = [str(root_dir)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in CARGO_SCAN_EXCLUDED_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name == 'Cargo.toml':
+                        yield Path(entry.path)
+        except OSError:
+            # Unreadable or vanished directory - skip it
+            continue
+
 def find_all_cargo_files_fast() -> List[Path]:
-    """Fast discovery of all Cargo.toml files using find command"""
+    """Fast discovery of all Cargo.toml files under RUST_REPO_ROOT (in-process, no find fork)"""
     if not RUST_REPO_ROOT:
         return []
 
-    try:
-        # Use find command for speed, exclude target and backup/dev/archive directories
-        cmd = [
-            'find', RUST_REPO_ROOT,
-            '-name', 'Cargo.toml',
-            '-not', '-path', '*/target/*',
-            '-not', '-path', '*/ref/*',
-            '-not', '-path', '*/howto/*',
-            '-not', '-path', '*/_arch/*',
-            '-not', '-path', '*/archive/*',
-            '-not', '-path', '*/bak/*',
-            '-not', '-path', '*/dev/*'
-        ]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        if result.returncode == 0:
-            paths = [Path(line.strip()) for line in result.stdout.strip().split('\n') if line.strip()]
-            return paths
-        else:
-            print(f"{Colors.YELLOW}⚠️  find command failed, falling back to Python search{Colors.END}")
-            return find_cargo_files(RUST_REPO_ROOT)
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        print(f"{Colors.YELLOW}⚠️  find command not available, using Python search{Colors.END}")
-        return find_cargo_files(RUST_REPO_ROOT)
+    return list(iter_cargo_files(RUST_REPO_ROOT))
 
 def compute_tree_md5(cargo_files: List[Path]) -> str:
     """Compute MD5 hash of the Cargo.toml file list for cache validation.
@@ -1753,7 +1884,7 @@ def detect_library_type(cargo_data: Dict) -> str:
 def get_repo_info(cargo_path: Path) -> Optional[Dict]:
     """Get repository information from Cargo.toml file"""
     try:
-        cargo_data = load_toml(cargo_path)
+        cargo_data = load_toml_cached(cargo_path)
 
         # Get basic package info
         package_info = cargo_data.get('package', {})
@@ -1818,7 +1949,7 @@ def detect_hub_usage(cargo_path: Path, hub_info: Optional[HubInfo]) -> Tuple[str
         return "NONE", "none"
 
     try:
-        cargo_data = load_toml(cargo_path)
+        cargo_data = load_toml_cached(cargo_path)
 
         deps_section = cargo_data.get('dependencies', {})
 
@@ -1859,7 +1990,7 @@ def extract_repo_metadata_batch(cargo_files: List[Path], hub_info: Optional[HubI
 
         # Load cargo data for internal/org/group detection
         try:
-            cargo_data = load_toml(cargo_path)
+            cargo_data = load_toml_cached(cargo_path)
         except:
             cargo_data = {}
 
@@ -1884,7 +2015,8 @@ def extract_repo_metadata_batch(cargo_files: List[Path], hub_info: Optional[HubI
             is_internal="true" if is_internal else "false",
             org=org,
             group=group,
-            library_type=library_type
+            library_type=library_type,
+            hub_meta=repo_info['hub_meta']
         ))
         repo_id += 1
 
@@ -1921,7 +2053,7 @@ def extract_dependencies_batch(cargo_files: List[Path]) -> List[DepData]:
             if str(cargo_path) not in repo_lookup:
                 continue
 
-            cargo_data = load_toml(cargo_path)
+            cargo_data = load_toml_cached(cargo_path)
             current_repo_id = repo_lookup[str(cargo_path)]
 
             # Process regular dependencies
@@ -2046,8 +2178,9 @@ def resolve_git_version(git_repo: str, git_ref: str) -> str:
             git_env = {**os.environ, 'GIT_TERMINAL_PROMPT': '0'}
 
             result = subprocess.run(
-                ['git', 'ls-remote', '--heads', git_repo],
-                capture_output=True,
+                [*GIT_PROBE_COMMAND, git_repo, 'HEAD'],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 timeout=5,
                 env=git_env,
@@ -2085,10 +2218,9 @@ def resolve_git_version(git_repo: str, git_ref: str) -> str:
                 return f"GIT#{git_ref[:8] if len(git_ref) > 8 else git_ref}"
             else:
                 # Check if it's an auth issue
-                error_msg = result.stderr.lower()
-                if 'permission denied' in error_msg or 'authentication failed' in error_msg:
+                if GIT_AUTH_ERROR_RE.search(result.stderr):
                     return "AUTH_REQUIRED"
-                elif 'not found' in error_msg or 'could not read' in error_msg:
+                elif GIT_MISSING_ERROR_RE.search(result.stderr):
                     return "NOT_FOUND"
                 else:
                     return "GIT_ERROR"
@@ -2109,7 +2241,7 @@ def collect_unique_packages_with_sources(cargo_files: List[Path]) -> Dict[str, T
 
     for cargo_path in cargo_files:
         try:
-            cargo_data = load_toml(cargo_path)
+            cargo_data = load_toml_cached(cargo_path)
 
             # Process regular dependencies
             if 'dependencies' in cargo_data:
@@ -2383,9 +2515,11 @@ def write_tsv_cache(repos: List[RepoData], deps: List[DepData], latest_versions:
     with open(output_file, 'a') as f:
         # Section 1: REPO LIST
         f.write("#------ SECTION : REPO LIST --------#\n")
-        f.write("REPO_ID\tREPO_NAME\tPATH\tPARENT\tLAST_UPDATE\tCARGO_VERSION\tHUB_USAGE\tHUB_STATUS\tIS_INTERNAL\tORG\tGROUP\tLIBRARY_TYPE\n")
+        f.write("REPO_ID\tREPO_NAME\tPATH\tPARENT\tLAST_UPDATE\tCARGO_VERSION\tHUB_USAGE\tHUB_STATUS\tIS_INTERNAL\tORG\tGROUP\tLIBRARY_TYPE\tHUB_META\n")
         for repo in repos:
-            f.write(f"{repo.repo_id}\t{repo.repo_name}\t{repo.path}\t{repo.parent}\t{repo.last_update}\t{repo.cargo_version}\t{repo.hub_usage}\t{repo.hub_status}\t{repo.is_internal}\t{repo.org}\t{repo.group}\t{repo.library_type}\n")
+            # HUB_META is JSON so multiline notes stay on one TSV row
+            hub_meta_json = json.dumps(repo.hub_meta, default=str)
+            f.write(f"{repo.repo_id}\t{repo.repo_name}\t{repo.path}\t{repo.parent}\t{repo.last_update}\t{repo.cargo_version}\t{repo.hub_usage}\t{repo.hub_status}\t{repo.is_internal}\t{repo.org}\t{repo.group}\t{repo.library_type}\t{hub_meta_json}\n")
         f.write("\n")
 
         # Section 2: DEPS VERSIONS LIST
@@ -2476,6 +2610,7 @@ def hydrate_tsv_cache(cache_file: str = None) -> EcosystemData:
                     org = parts[9] if len(parts) >= 10 else ""
                     group = parts[10] if len(parts) >= 11 else ""
                     library_type = parts[11] if len(parts) >= 12 else "project"
+                    hub_meta = json.loads(parts[12]) if len(parts) >= 13 else {}
 
                     repo = RepoData(
                         repo_id=int(parts[0]),
@@ -2489,7 +2624,8 @@ def hydrate_tsv_cache(cache_file: str = None) -> EcosystemData:
                         is_internal=is_internal,
                         org=org,
                         group=group,
-                        library_type=library_type
+                        library_type=library_type,
+                        hub_meta=hub_meta
                     )
                     repos[repo.repo_id] = repo
 
@@ -2674,7 +2810,7 @@ def get_hub_dependencies():
 
     if hub_cargo_path.exists():
         try:
-            cargo_data = load_toml(hub_cargo_path)
+            cargo_data = load_toml_cached(hub_cargo_path)
 
             # Parse regular dependencies
             if 'dependencies' in cargo_data:
@@ -2923,6 +3059,7 @@ def generate_data_cache(dependencies, fast_mode=False):
     output_file = get_data_file_path("deps_cache.tsv")
     print(f"{Colors.CYAN}Phase 6: Writing cache to {output_file}...{Colors.END}")
     write_tsv_cache(repos, deps, latest_versions, version_maps, output_file)
+    discover_repositories.cache_clear()  # Repo list may have changed
 
     # Save tree metadata for future cache validation
     processing_time = time.time() - start_time
@@ -4836,9 +4973,15 @@ def view_graph(ecosystem: EcosystemData, package: str) -> None:
                         status = f" {Colors.YELLOW}(outdated){Colors.END}"
                 print(f"  {version:10} {Colors.GREEN}{bar}{Colors.END} ({count} repos){status}")
 
+@lru_cache(maxsize=2)
 def discover_repositories(force_live=False):
     """Discover repository paths using cache or live discovery
 
+    Results are memoized per process (keyed on force_live), so repeated calls
+    within one CLI run skip the filesystem walk and the progress output.
+    Call discover_repositories.cache_clear() after anything that changes the
+    repository tree or the TSV cache.
+
     Args:
         force_live: If True, force live discovery even if cache exists
 
@@ -4876,6 +5019,42 @@ def list_repositories(force_live=False):
     for i, repo_path in enumerate(sorted(repo_paths, key=lambda p: p.name), 1):
         print(f"{Colors.BLUE}{i:2d}.{Colors.END} {Colors.BOLD}{repo_path.name}{Colors.END}")
 
+# cargo clean (1.75+) reports e.g. "Removed 1234 files, 456.7MiB total" on stderr;
+# nothing-to-free summaries ("Removed 0 files", "Removed 1 directory") have no total
+CARGO_CLEAN_SUMMARY_RE = re.compile(
+    r'Removed\s+\d+\s+(?:files?|director(?:y|ies))(?:,\s+([\d.]+)\s*([KMGT]?i?B)\s+total)?')
+BYTE_UNITS = {'B': 1, 'KiB': 1024, 'MiB': 1024 ** 2, 'GiB': 1024 ** 3, 'TiB': 1024 ** 4,
+              'KB': 1000, 'MB': 1000 ** 2, 'GB': 1000 ** 3, 'TB': 1000 ** 4}
+
+def parse_cargo_clean_freed_bytes(output: str) -> Optional[int]:
+    """Extract bytes freed from cargo clean's summary line, or None if there is no
+    "Removed" summary (older cargo). A summary without a total counts as 0 bytes."""
+    match = CARGO_CLEAN_SUMMARY_RE.search(output)
+    if not match:
+        return None
+    if match.group(1) is None:
+        return 0
+    if match.group(2) not in BYTE_UNITS:
+        return None
+    return int(float(match.group(1)) * BYTE_UNITS[match.group(2)])
+
+def get_dir_size_bytes(path: Path) -> int:
+    """Total size of regular files under path (symlinks not followed)"""
+    total = 0
+    stack = [str(path)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            continue
+    return total
+
 def superclean_targets():
     """Clean target directories across all ecosystem repositories"""
     print(f"{Colors.CYAN}{Colors.BOLD}🧹 SuperClean: Cleaning all target directories in ecosystem{Colors.END}")
@@ -4883,7 +5062,8 @@ def superclean_targets():
     repo_paths = discover_repositories()
 
     cleaned_count = 0
-    total_size_freed = 0
+    total_size_freed = 0  # MB
+    cargo_reports_size = None  # Unknown until the first cargo clean
 
     # Initialize progress spinner
     progress = ProgressSpinner("Initializing cleanup...", len(repo_paths))
@@ -4904,10 +5084,15 @@ def superclean_targets():
                 try:
                     progress.update(i, f"Cleaning {repo_path.name}...")
 
-                    # Get size before cleaning
-                    result = subprocess.run(['du', '-sh', str(target_path)],
-                                          capture_output=True, text=True, timeout=10)
-                    size_str = result.stdout.split('\t')[0] if result.returncode == 0 else "unknown"
+                    # Empty target dir: remove it directly and skip cargo's toolchain startup
+                    if not any(target_path.iterdir()):
+                        target_path.rmdir()
+                        cleaned_count += 1
+                        continue
+
+                    # Older cargo doesn't report freed bytes; once we know that,
+                    # measure the target dir ourselves before cleaning
+                    size_before = get_dir_size_bytes(target_path) if cargo_reports_size is False else None
 
                     # Use cargo clean in the repo directory
                     result = subprocess.run(['cargo', 'clean'],
@@ -4916,13 +5101,13 @@ def superclean_targets():
 
                     if result.returncode == 0:
                         cleaned_count += 1
-                        # Try to extract numeric size for total
-                        if size_str.endswith('M'):
-                            total_size_freed += float(size_str[:-1])
-                        elif size_str.endswith('G'):
-                            total_size_freed += float(size_str[:-1]) * 1024
-                        elif size_str.endswith('K'):
-                            total_size_freed += float(size_str[:-1]) / 1024
+                        freed_bytes = parse_cargo_clean_freed_bytes(result.stderr + result.stdout)
+                        if freed_bytes is not None:
+                            cargo_reports_size = True
+                        else:
+                            cargo_reports_size = False
+                            freed_bytes = size_before or 0
+                        total_size_freed += freed_bytes / (1024 * 1024)
 
                 except subprocess.TimeoutExpired:
                     pass  # Continue with other repos
@@ -4946,9 +5131,95 @@ def superclean_targets():
         else:
             print(f"   💾 Freed approximately {total_size_freed:.0f}MB of disk space")
 
+# OpenSSH multiplexing: one authenticated master connection shared by the
+# SSH test and every git push during tap. %n (the host as typed, i.e. the
+# alias) keeps masters for aliases of one HostName apart - each alias can
+# carry its own IdentityFile - and %r@%h:%p separates users and ports.
+SSH_CONTROL_PERSIST = '60s'
+
+def get_ssh_control_dir() -> str:
+    """Per-user 0700 directory for ControlPath sockets (ssh_config(5) requires
+    that other users can't write to it, which rules out the shared temp dir)"""
+    control_dir = get_cache_file_path('ssh')
+    os.makedirs(control_dir, mode=0o700, exist_ok=True)
+    os.chmod(control_dir, 0o700)
+    return control_dir
+
+def get_ssh_multiplex_options() -> List[str]:
+    """SSH options that reuse the blade master connection when one is open"""
+    return ['-o', f'ControlPath={os.path.join(get_ssh_control_dir(), "%n-%r@%h:%p")}']
+
+def user_ssh_command_configured(repo_path: Optional[Path] = None) -> bool:
+    """True if the user picks git's ssh via GIT_SSH_COMMAND, GIT_SSH or core.sshCommand"""
+    if 'GIT_SSH_COMMAND' in os.environ or 'GIT_SSH' in os.environ:
+        return True
+    try:
+        result = subprocess.run(['git', 'config', '--get', 'core.sshCommand'],
+                                cwd=str(repo_path) if repo_path else None,
+                                stdin=subprocess.DEVNULL, capture_output=True, text=True, timeout=5)
+    except (subprocess.TimeoutExpired, OSError):
+        return False
+    return bool(result.stdout.strip())
+
+def get_git_ssh_env(repo_path: Optional[Path] = None) -> Dict[str, str]:
+    """Environment for git subprocesses so pushes go through the SSH master.
+
+    Left untouched when the user already chooses the ssh command
+    (GIT_SSH_COMMAND, GIT_SSH or core.sshCommand, checked in repo_path),
+    so their identity and options still apply.
+    """
+    env = dict(os.environ)
+    if not user_ssh_command_configured(repo_path):
+        env['GIT_SSH_COMMAND'] = ' '.join(['ssh'] + [shlex.quote(opt) for opt in get_ssh_multiplex_options()])
+    return env
+
+def ssh_master_running(ssh_profile: str) -> bool:
+    """True if a master connection is already listening on the ControlPath"""
+    cmd = ['ssh', '-O', 'check', *get_ssh_multiplex_options(), f'git@{ssh_profile}']
+    try:
+        result = subprocess.run(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                                stderr=subprocess.DEVNULL, timeout=5)
+        return result.returncode == 0
+    except (subprocess.TimeoutExpired, OSError):
+        return False
+
+def start_ssh_master(ssh_profile: str, timeout: int = 10, batch_mode: bool = False) -> bool:
+    """Open a background SSH master connection (ssh -MNf) for later reuse
+
+    Returns True only if this call started the master (the caller then
+    closes it with stop_ssh_master). A master already on the socket, e.g.
+    from a concurrent run, is left alone: starting another would print
+    "ControlSocket already exists" and leave an orphaned ssh -N session.
+
+    batch_mode disables host-key and passphrase prompts, which ssh would
+    otherwise send to /dev/tty even with stdin closed.
+    """
+    if ssh_master_running(ssh_profile):
+        return False
+    cmd = ['ssh', '-MNf', '-o', f'ControlPersist={SSH_CONTROL_PERSIST}',
+           *(['-o', 'BatchMode=yes'] if batch_mode else []),
+           *get_ssh_multiplex_options(), f'git@{ssh_profile}']
+    try:
+        result = subprocess.run(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                                stderr=subprocess.DEVNULL, timeout=timeout)
+        return result.returncode == 0
+    except (subprocess.TimeoutExpired, OSError):
+        return False
+
+def stop_ssh_master(ssh_profile: str):
+    """Close the background SSH master connection, if one is running"""
+    cmd = ['ssh', '-O', 'exit', *get_ssh_multiplex_options(), f'git@{ssh_profile}']
+    try:
+        subprocess.run(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                       stderr=subprocess.DEVNULL, timeout=5)
+    except (subprocess.TimeoutExpired, OSError):
+        pass
+
 def test_ssh_connection(ssh_profile=None):
     """Test SSH connection with configurable profile
 
+    Reuses the blade SSH master connection when one has been started.
+
     Args:
         ssh_profile: SSH profile/host. Defaults to RUST_SSH_PROFILE env var or 'github.com'
                     Use 'qodeninja' for your custom profile
@@ -4966,7 +5237,7 @@ def test_ssh_connection(ssh_profile=None):
     # Test SSH connection
     print(f"{Colors.YELLOW}🔐 Testing SSH connection: {' '.join(ssh_test_cmd)}...{Colors.END}")
     try:
-        result = subprocess.run(ssh_test_cmd,
+        result = subprocess.run(ssh_test_cmd[:1] + get_ssh_multiplex_options() + ssh_test_cmd[1:],
                               capture_output=True, text=True, timeout=10)
 
         # Check for success in both stdout and stderr
@@ -4986,6 +5257,104 @@ def test_ssh_connection(ssh_profile=None):
         print(f"{Colors.RED}❌ SSH test failed: {e}{Colors.END}")
         return False
 
+# Hooks 'git commit' runs that libgit2 would silently skip
+TAP_COMMIT_HOOKS = ('pre-commit', 'prepare-commit-msg', 'commit-msg', 'post-commit')
+
+def _pygit2_commit_needs_cli(repo, status) -> bool:
+    """True if an in-process commit would differ from 'git add . && git commit'
+
+    libgit2 doesn't run commit hooks, honour commit.gpgsign or run external
+    clean filters (e.g. Git LFS), so those repos go through the git CLI.
+    """
+    config = repo.config
+    if 'commit.gpgsign' in config and config.get_bool('commit.gpgsign'):
+        return True
+
+    hooks_dir = Path(repo.path) / 'hooks'
+    if 'core.hooksPath' in config:
+        hooks_dir = Path(repo.workdir or repo.path) / Path(config['core.hooksPath']).expanduser()
+    if any(os.access(hooks_dir / hook, os.X_OK) for hook in TAP_COMMIT_HOOKS):
+        return True
+
+    return any(repo.get_attr(path, 'filter') for path in status)
+
+@lru_cache(maxsize=1)
+def load_pygit2():
+    """Import optional pygit2 on first use (only tap commits need it); None if missing"""
+    try:
+        import pygit2
+    except ImportError:
+        return None
+    return pygit2
+
+def _tap_commit_pygit2(repo_path: Path, commit_message: str) -> Optional[str]:
+    """Stage and commit all changes in-process via pygit2 (no git forks)
+
+    Returns None when the repo needs the git CLI (hooks, signing, filters).
+    """
+    pygit2 = load_pygit2()
+    repo = pygit2.Repository(str(repo_path))
+    status = repo.status()
+    if not status:
+        return "clean"
+    if _pygit2_commit_needs_cli(repo, status):
+        return None
+
+    # Mirror 'git add .': stage new/modified files and record deletions
+    index = repo.index
+    index.add_all()
+    for path, flags in status.items():
+        if flags & pygit2.GIT_STATUS_WT_DELETED:
+            index.remove(path)
+    index.write()
+
+    tree = index.write_tree()
+    signature = repo.default_signature
+    parents = [] if repo.head_is_unborn else [repo.head.target]
+    repo.create_commit('HEAD', signature, signature, commit_message, tree, parents)
+    return "committed"
+
+def _tap_commit_subprocess(repo_path: Path, commit_message: str) -> str:
+    """Stage and commit all changes using the git CLI"""
+    result = subprocess.run(['git', 'status', '--porcelain'],
+                          cwd=str(repo_path),
+                          capture_output=True, text=True, timeout=30)
+    if result.returncode != 0:
+        return "error"
+    if not result.stdout.strip():
+        return "clean"
+
+    add_result = subprocess.run(['git', 'add', '.'],
+                              cwd=str(repo_path),
+                              capture_output=True, text=True, timeout=30)
+    if add_result.returncode != 0:
+        return "error"
+
+    commit_result = subprocess.run(['git', 'commit', '-m', commit_message],
+                                 cwd=str(repo_path),
+                                 capture_output=True, text=True, timeout=30)
+    return "committed" if commit_result.returncode == 0 else "error"
+
+def tap_commit_changes(repo_path: Path, commit_message: str) -> str:
+    """Commit all changes in a repository for tap
+
+    Uses pygit2 when installed, falling back to the git CLI if it is missing,
+    the repo has commit hooks, signing or filter attributes configured, or
+    the in-process commit fails (e.g. no user.name/user.email configured).
+
+    Returns:
+        str: "committed", "clean" (nothing to commit) or "error"
+    """
+    pygit2 = load_pygit2()
+    if pygit2 is not None:
+        try:
+            outcome = _tap_commit_pygit2(repo_path, commit_message)
+            if outcome is not None:
+                return outcome
+        except (pygit2.GitError, KeyError, ValueError, OSError):
+            pass
+    return _tap_commit_subprocess(repo_path, commit_message)
+
 def tap_repositories(ssh_profile=None):
     """Tap repositories - commit changes always, push only if SSH test passes
 
@@ -4997,65 +5366,49 @@ def tap_repositories(ssh_profile=None):
 
     print(f"{Colors.CYAN}{Colors.BOLD}🚰 Tap: Auto-committing across ecosystem repositories{Colors.END}")
 
-    # Test SSH connection to determine if we can push
-    ssh_ok = test_ssh_connection(ssh_profile)
-    if ssh_ok:
-        print(f"{Colors.GREEN}🔗 SSH verified - will commit and push changes{Colors.END}")
-    else:
-        print(f"{Colors.YELLOW}⚠️  SSH failed - will only commit changes (no push){Colors.END}")
-
-    # Get repository list
-    repo_paths = discover_repositories()
-
-    committed_count = 0
-    pushed_count = 0
-    skipped_count = 0
-    error_count = 0
-    current_date = datetime.now().strftime("%Y-%m-%d")
-
-    # Initialize progress spinner
-    progress = ProgressSpinner("Initializing tap...", len(repo_paths))
-    progress.start()
+    if ssh_profile is None:
+        ssh_profile = os.environ.get('RUST_SSH_PROFILE', 'github.com')
 
+    # Open one SSH master up-front so the test and all pushes share it
+    # (one already left by a concurrent run is reused, not closed)
+    master_started = False
     try:
-        for i, repo_path in enumerate(repo_paths):
-            progress.update(i, f"Tapping {repo_path.name}...")
+        master_started = start_ssh_master(ssh_profile)
 
-            # Skip if not a git repository
-            if not (repo_path / ".git").exists():
-                skipped_count += 1
-                continue
+        # Test SSH connection to determine if we can push
+        ssh_ok = test_ssh_connection(ssh_profile)
+        if ssh_ok:
+            print(f"{Colors.GREEN}🔗 SSH verified - will commit and push changes{Colors.END}")
+        else:
+            print(f"{Colors.YELLOW}⚠️  SSH failed - will only commit changes (no push){Colors.END}")
 
-            try:
-                # Check git status
-                result = subprocess.run(['git', 'status', '--porcelain'],
-                                      cwd=str(repo_path),
-                                      capture_output=True, text=True, timeout=30)
+        # Get repository list
+        repo_paths = discover_repositories()
 
-                if result.returncode != 0:
-                    error_count += 1
-                    continue
+        committed_count = 0
+        pushed_count = 0
+        skipped_count = 0
+        error_count = 0
+        current_date = datetime.now().strftime("%Y-%m-%d")
+        commit_message = f"fix: hub batch auto tap {current_date}"
 
-                # If there are changes, add and commit them
-                if result.stdout.strip():
-                    progress.update(i, f"Committing changes in {repo_path.name}...")
+        # Initialize progress spinner
+        progress = ProgressSpinner("Initializing tap...", len(repo_paths))
+        progress.start()
 
-                    # Add all changes
-                    add_result = subprocess.run(['git', 'add', '.'],
-                                              cwd=str(repo_path),
-                                              capture_output=True, text=True, timeout=30)
+        try:
+            for i, repo_path in enumerate(repo_paths):
+                progress.update(i, f"Tapping {repo_path.name}...")
 
-                    if add_result.returncode != 0:
-                        error_count += 1
-                        continue
+                # Skip if not a git repository
+                if not (repo_path / ".git").exists():
+                    skipped_count += 1
+                    continue
 
-                    # Commit with standardized message
-                    commit_message = f"fix: hub batch auto tap {current_date}"
-                    commit_result = subprocess.run(['git', 'commit', '-m', commit_message],
-                                                 cwd=str(repo_path),
-                                                 capture_output=True, text=True, timeout=30)
+                try:
+                    outcome = tap_commit_changes(repo_path, commit_message)
 
-                    if commit_result.returncode == 0:
+                    if outcome == "committed":
                         committed_count += 1
 
                         # If SSH is OK, also push the changes
@@ -5063,27 +5416,31 @@ def tap_repositories(ssh_profile=None):
                             progress.update(i, f"Pushing changes in {repo_path.name}...")
                             push_result = subprocess.run(['git', 'push'],
                                                        cwd=str(repo_path),
-                                                       capture_output=True, text=True, timeout=60)
+                                                       capture_output=True, text=True, timeout=60,
+                                                       env=get_git_ssh_env(repo_path))
 
                             if push_result.returncode == 0:
                                 pushed_count += 1
                             # Don't count push failure as error - commit succeeded
+                    elif outcome == "clean":
+                        # No changes to commit
+                        skipped_count += 1
                     else:
                         error_count += 1
-                else:
-                    # No changes to commit
-                    skipped_count += 1
 
-            except subprocess.TimeoutExpired:
-                error_count += 1
-            except Exception:
-                error_count += 1
+                except subprocess.TimeoutExpired:
+                    error_count += 1
+                except Exception:
+                    error_count += 1
 
-        # Final update
-        progress.update(len(repo_paths), "Tap complete!")
+            # Final update
+            progress.update(len(repo_paths), "Tap complete!")
 
+        finally:
+            progress.stop()
     finally:
-        progress.stop()
+        if master_started:
+            stop_ssh_master(ssh_profile)
 
     # Summary
     print(f"\n{Colors.GREEN}{Colors.BOLD}✅ Tap Complete!{Colors.END}")
@@ -5219,129 +5576,156 @@ def write_cargo_toml_manually(cargo_path: Path, package_name: str, version: str,
         print(f"{Colors.RED}❌ Error manually editing Cargo.toml: {e}{Colors.END}")
         return False
 
-def learn_package(ecosystem: EcosystemData, package_name: str) -> bool:
-    """Learn a package by adding it to hub's Cargo.toml with its latest version"""
+def get_learn_target(ecosystem: EcosystemData, package_name: str) -> Optional[Tuple[str, str]]:
+    """Validate a package for learning and return (latest_version, domain), or None if it can't be learned"""
 
     # Skip RSB package
     if package_name.lower() == 'rsb':
         print(f"{Colors.YELLOW}⚠️  Cannot learn 'rsb' package (circular dependency){Colors.END}")
-        return False
+        return None
 
     # Check if package exists in ecosystem
     if package_name not in ecosystem.latest:
         print(f"{Colors.RED}❌ Package '{package_name}' not found in ecosystem{Colors.END}")
-        return False
+        return None
 
     pkg_info = ecosystem.latest[package_name]
 
     # Check if already in hub
     if pkg_info.hub_status in ['current', 'outdated']:
         print(f"{Colors.YELLOW}⚠️  Package '{package_name}' already in hub (status: {pkg_info.hub_status}){Colors.END}")
-        return False
+        return None
 
     # Get the latest stable version
     latest_version = pkg_info.latest_stable_version or pkg_info.latest_version
 
+    # Determine which domain feature group this package belongs to
+    domain = categorize_package(package_name)
+
+    return latest_version, domain
+
+def add_package_to_hub_data(cargo_data: Dict, package_name: str, version: str, domain: str) -> None:
+    """Add an optional dependency and its feature wiring to parsed hub Cargo.toml data"""
+    # Ensure dependencies section exists
+    if 'dependencies' not in cargo_data:
+        cargo_data['dependencies'] = {}
+
+    # Add the package with optional = true (for feature gating)
+    cargo_data['dependencies'][package_name] = {
+        'version': version,
+        'optional': True
+    }
+
+    # Update features section to include this package
+    if 'features' not in cargo_data:
+        cargo_data['features'] = {}
+
+    # Add to domain feature group
+    if domain not in cargo_data['features']:
+        cargo_data['features'][domain] = []
+
+    if package_name not in cargo_data['features'][domain]:
+        cargo_data['features'][domain].append(package_name)
+
+    # Also ensure package has its own feature
+    if package_name not in cargo_data['features']:
+        cargo_data['features'][package_name] = [f"dep:{package_name}"]
+
+def learn_packages(ecosystem: EcosystemData, package_names: List[str]) -> int:
+    """Learn packages by adding them to hub's Cargo.toml with their latest versions.
+
+    All packages are applied to a single parse of the file and written back
+    once. Returns the number of packages learned.
+    """
+    targets = []
+    for package_name in package_names:
+        target = get_learn_target(ecosystem, package_name)
+        if target:
+            targets.append((package_name, *target))
+
+    if not targets:
+        return 0
+
     # Load hub's Cargo.toml path (using configurable HUB_PATH)
     if not HUB_PATH:
         print(f"{Colors.RED}❌ HUB_PATH not configured. Set HUB_HOME or HUB_PATH environment variable.{Colors.END}")
-        return False
+        return 0
     hub_cargo_path = Path(HUB_PATH) / "Cargo.toml"
 
-    # Determine which domain feature group this package belongs to
-    domain = categorize_package(package_name)
-
     # Try to use toml library first, fallback to manual editing
     try:
         import toml
         cargo_data = load_toml(hub_cargo_path)
 
-        # Ensure dependencies section exists
-        if 'dependencies' not in cargo_data:
-            cargo_data['dependencies'] = {}
-
-        # Add the package with optional = true (for feature gating)
-        cargo_data['dependencies'][package_name] = {
-            'version': latest_version,
-            'optional': True
-        }
-
-        # Update features section to include this package
-        if 'features' not in cargo_data:
-            cargo_data['features'] = {}
-
-        # Add to domain feature group
-        if domain not in cargo_data['features']:
-            cargo_data['features'][domain] = []
-
-        if package_name not in cargo_data['features'][domain]:
-            cargo_data['features'][domain].append(package_name)
-
-        # Also ensure package has its own feature
-        if package_name not in cargo_data['features']:
-            cargo_data['features'][package_name] = [f"dep:{package_name}"]
+        for package_name, latest_version, domain in targets:
+            add_package_to_hub_data(cargo_data, package_name, latest_version, domain)
 
         # Write back the updated Cargo.toml
         with open(hub_cargo_path, 'w') as f:
             toml.dump(cargo_data, f)
 
-        print(f"{Colors.GREEN}✅ Learned '{package_name}' v{latest_version} → {domain} domain{Colors.END}")
-        return True
+        for package_name, latest_version, domain in targets:
+            print(f"{Colors.GREEN}✅ Learned '{package_name}' v{latest_version} → {domain} domain{Colors.END}")
+        return len(targets)
 
     except ImportError:
         # Fallback to manual editing
         print(f"{Colors.YELLOW}⚠️  toml library not available, using manual editing{Colors.END}")
-        if write_cargo_toml_manually(hub_cargo_path, package_name, latest_version, domain):
-            print(f"{Colors.GREEN}✅ Learned '{package_name}' v{latest_version} → {domain} domain{Colors.END}")
-            return True
-        else:
-            return False
+        learned_count = 0
+        for package_name, latest_version, domain in targets:
+            if write_cargo_toml_manually(hub_cargo_path, package_name, latest_version, domain):
+                print(f"{Colors.GREEN}✅ Learned '{package_name}' v{latest_version} → {domain} domain{Colors.END}")
+                learned_count += 1
+        return learned_count
 
     except Exception as e:
         print(f"{Colors.RED}❌ Failed to update hub's Cargo.toml: {e}{Colors.END}")
-        return False
-
-def categorize_package(package_name: str) -> str:
-    """Categorize package into a domain based on its name/purpose"""
-    # Common categorization patterns
-    text_packages = ['regex', 'unicode', 'string', 'text', 'markdown', 'html']
-    data_packages = ['serde', 'json', 'toml', 'yaml', 'csv', 'xml', 'bincode']
-    time_packages = ['chrono', 'time', 'date', 'duration', 'timer']
-    web_packages = ['http', 'url', 'reqwest', 'hyper', 'actix', 'warp', 'rocket', 'tower']
-    system_packages = ['libc', 'nix', 'winapi', 'os', 'env', 'process', 'fs']
-    dev_packages = ['log', 'tracing', 'env_logger', 'pretty', 'debug', 'test']
-    random_packages = ['rand', 'uuid', 'nanoid', 'random']
-
-    name_lower = package_name.lower()
-
-    # Check each category
-    for keyword in text_packages:
-        if keyword in name_lower:
-            return 'text'
+        return 0
 
-    for keyword in data_packages:
-        if keyword in name_lower:
-            return 'data'
+def learn_package(ecosystem: EcosystemData, package_name: str) -> bool:
+    """Learn a package by adding it to hub's Cargo.toml with its latest version"""
+    return learn_packages(ecosystem, [package_name]) == 1
+
+# Domain feature groups for learned packages, in priority order: when a name
+# matches keywords from several domains, the earliest domain wins
+DOMAIN_KEYWORDS = (
+    ('text', ['regex', 'unicode', 'string', 'text', 'markdown', 'html']),
+    ('data', ['serde', 'json', 'toml', 'yaml', 'csv', 'xml', 'bincode']),
+    ('time', ['chrono', 'time', 'date', 'duration', 'timer']),
+    ('web', ['http', 'url', 'reqwest', 'hyper', 'actix', 'warp', 'rocket', 'tower']),
+    ('system', ['libc', 'nix', 'winapi', 'os', 'env', 'process', 'fs']),
+    ('dev', ['log', 'tracing', 'env_logger', 'pretty', 'debug', 'test']),
+    ('random', ['rand', 'uuid', 'nanoid', 'random']),
+)
+
+def build_domain_automaton():
+    """Compile DOMAIN_KEYWORDS into an Aho-Corasick automaton (None without pyahocorasick)"""
+    if ahocorasick is None:
+        return None
 
-    for keyword in time_packages:
-        if keyword in name_lower:
-            return 'time'
+    automaton = ahocorasick.Automaton()
+    for priority, (domain, keywords) in enumerate(DOMAIN_KEYWORDS):
+        for keyword in keywords:
+            if not automaton.exists(keyword):
+                automaton.add_word(keyword, (priority, domain))
+    automaton.make_automaton()
+    return automaton
 
-    for keyword in web_packages:
-        if keyword in name_lower:
-            return 'web'
+DOMAIN_AUTOMATON = build_domain_automaton()
 
-    for keyword in system_packages:
-        if keyword in name_lower:
-            return 'system'
+def categorize_package(package_name: str) -> str:
+    """Categorize package into a domain based on its name/purpose"""
+    name_lower = package_name.lower()
 
-    for keyword in dev_packages:
-        if keyword in name_lower:
-            return 'dev'
+    # Single pass over the name, keeping the highest-priority domain matched
+    if DOMAIN_AUTOMATON is not None:
+        matches = [match for _, match in DOMAIN_AUTOMATON.iter(name_lower)]
+        return min(matches)[1] if matches else 'common'
 
-    for keyword in random_packages:
-        if keyword in name_lower:
-            return 'random'
+    for domain, keywords in DOMAIN_KEYWORDS:
+        for keyword in keywords:
+            if keyword in name_lower:
+                return domain
 
     # Default to 'common' for uncategorized packages
     return 'common'
@@ -5349,15 +5733,17 @@ def categorize_package(package_name: str) -> str:
 def add_hub_metadata_section(cargo_path: Path, repo_name: str) -> bool:
     """Add [package.metadata.hub] section to a Cargo.toml file"""
     try:
+        # Check if the section already exists by scanning raw bytes (no decode)
+        with open(cargo_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size > 0:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if mm.find(b'[package.metadata.hub]') != -1:
+                        print(f"{Colors.YELLOW}⚠️  [package.metadata.hub] section already exists{Colors.END}")
+                        return False
+
         with open(cargo_path, 'r') as f:
             lines = f.readlines()
 
-        # Check if the section already exists
-        for line in lines:
-            if '[package.metadata.hub]' in line:
-                print(f"{Colors.YELLOW}⚠️  [package.metadata.hub] section already exists{Colors.END}")
-                return False
-
         # Find where to insert the metadata section
         # Look for [package.metadata] first, or [package] section
         package_metadata_idx = -1
@@ -5406,6 +5792,32 @@ def add_hub_metadata_section(cargo_path: Path, repo_name: str) -> bool:
         print(f"{Colors.RED}❌ Error adding hub metadata section: {e}{Colors.END}")
         return False
 
+# [package.metadata.hub] table body: everything up to the next (possibly indented) header
+HUB_METADATA_SECTION_RE = re.compile(rb'(?ms)^[ \t]*\[package\.metadata\.hub\][ \t]*(?:#[^\n]*)?\r?\n(.*?)(?=^[ \t]*\[|\Z)')
+
+def read_hub_metadata(cargo_path: Path) -> Dict:
+    """Read the [package.metadata.hub] table from a Cargo.toml.
+
+    Fast path: locate the section with a compiled regex over an mmap and
+    parse only that block. Falls back to a full TOML parse when the section
+    isn't a plain table (dotted keys, inline table), any package.metadata.hub.*
+    sub-table or array of tables appears later, or the extracted block
+    doesn't parse on its own.
+    """
+    try:
+        with open(cargo_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size > 0:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    match = HUB_METADATA_SECTION_RE.search(mm)
+                    # Sub-tables ([x] or [[x]]) anywhere later belong to the hub table too
+                    if match and mm.find(b'package.metadata.hub.', match.end()) == -1:
+                        return load_toml(match.group(1).decode('utf-8'), is_string=True)
+    except (ValueError, UnicodeDecodeError):
+        pass  # Block didn't parse standalone - use the full document
+
+    cargo_data = load_toml_cached(cargo_path)
+    return cargo_data.get('package', {}).get('metadata', {}).get('hub', {})
+
 def view_repo_notes(ecosystem: EcosystemData, repo_name: str, create_if_missing: bool = False) -> None:
     """Display hub annotations/notes for a specific repository, optionally creating the section if missing"""
 
@@ -5423,13 +5835,15 @@ def view_repo_notes(ecosystem: EcosystemData, repo_name: str, create_if_missing:
             print(f"  • {repo.repo_name}")
         return
 
-    # Load the Cargo.toml to get fresh metadata
     # Note: repo_found.path already includes "Cargo.toml"
     cargo_path = Path(RUST_REPO_ROOT) / repo_found.path
 
     try:
-        cargo_data = load_toml(cargo_path)
-        hub_meta = cargo_data.get('package', {}).get('metadata', {}).get('hub', {})
+        # Use metadata captured in the cache; only parse Cargo.toml when it's
+        # missing (older caches, or before creating the section)
+        hub_meta = repo_found.hub_meta
+        if not hub_meta:
+            hub_meta = read_hub_metadata(cargo_path)
 
         print(f"{Colors.PURPLE}{Colors.BOLD}📝 HUB NOTES: {repo_found.repo_name}{Colors.END}")
         print(f"{Colors.PURPLE}{'='*80}{Colors.END}\n")
@@ -5506,43 +5920,35 @@ def learn_all_opportunities(ecosystem: EcosystemData) -> int:
 
     # Count usage excluding hub repository and local/workspace
     hub_repo_id = get_hub_repo_id(ecosystem)
-    all_packages = {}
+    seen = set()
+    package_usage = Counter()
     for dep in ecosystem.deps.values():
         # Skip dependencies that should be excluded
         if should_exclude_from_stats(dep, hub_repo_id):
             continue
 
-        pkg_name = dep.pkg_name
-        if pkg_name not in all_packages:
-            all_packages[pkg_name] = set()
-        all_packages[pkg_name].add(dep.repo_id)
+        # Count each (package, repo) pair once
+        key = (dep.pkg_name, dep.repo_id)
+        if key in seen:
+            continue
+        seen.add(key)
+        package_usage[dep.pkg_name] += 1
 
-    # Convert to usage counts
-    package_usage = {pkg: len(repos) for pkg, repos in all_packages.items()}
-
-    # Find opportunities (5+ usage, not in hub, not rsb)
-    opportunities = []
-    for pkg_name, usage_count in package_usage.items():
-        if usage_count >= 5 and pkg_name not in actual_hub_packages and pkg_name.lower() != 'rsb':
-            opportunities.append((pkg_name, usage_count))
+    # Find opportunities (5+ usage, not in hub, not rsb), sorted by usage count
+    opportunities = [(pkg_name, usage_count) for pkg_name, usage_count in package_usage.most_common()
+                     if usage_count >= 5 and pkg_name not in actual_hub_packages and pkg_name.lower() != 'rsb']
 
     if not opportunities:
         print(f"{Colors.YELLOW}⚠️  No package opportunities found (5+ usage, not in hub){Colors.END}")
         return 0
 
-    # Sort by usage count
-    opportunities.sort(key=lambda x: -x[1])
-
     print(f"Found {len(opportunities)} packages to learn:\n")
     for pkg_name, count in opportunities:
         print(f"  • {pkg_name} (used by {count} repos)")
 
     print(f"\n{Colors.CYAN}Learning packages...{Colors.END}\n")
 
-    learned_count = 0
-    for pkg_name, _ in opportunities:
-        if learn_package(ecosystem, pkg_name):
-            learned_count += 1
+    learned_count = learn_packages(ecosystem, [pkg_name for pkg_name, _ in opportunities])
 
     print(f"\n{Colors.GREEN}✅ Successfully learned {learned_count}/{len(opportunities)} packages{Colors.END}")
 
@@ -5551,14 +5957,245 @@ def learn_all_opportunities(ecosystem: EcosystemData) -> int:
 
     return learned_count
 
+# Concurrent git ls-remote probes in scan-git (network-bound, so threads)
+GIT_PROBE_MAX_WORKERS = 32
+# Reachability check: protocol v2 lets the server filter to the single HEAD ref
+# instead of advertising every branch; the ref list itself is discarded
+GIT_PROBE_COMMAND = ('git', '-c', 'protocol.version=2', 'ls-remote')
+
+def probe_git_url(git_url: str, git_env: Dict[str, str]):
+    """Check a git URL with 'git ls-remote' without ever prompting for credentials.
+
+    Returns the CompletedProcess, or the exception (e.g. TimeoutExpired) so
+    callers running probes in a pool can classify failures per URL.
+    """
+    try:
+        return subprocess.run(
+            [*GIT_PROBE_COMMAND, git_url, 'HEAD'],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            timeout=3,
+            env=git_env,
+            stdin=subprocess.DEVNULL
+        )
+    except (subprocess.TimeoutExpired, OSError) as e:
+        return e
+
+# scan-git probe cache: reuse recent ls-remote outcomes across runs
+GIT_PROBE_CACHE_TTL_OK = 600        # seconds to trust an accessible result
+GIT_PROBE_CACHE_TTL_FAILED = 3600   # seconds to trust an auth/not-found result
+GIT_URL_HOST_RE = re.compile(r'^(?:[\w.+-]+://)?(?:[^@/]+@)?([^/:]*)')
+# SSH URLs a 'git@<alias>' master on the default port can serve (its ControlPath
+# is keyed on alias, user and port): ssh://git@alias/... or git@alias:...
+GIT_SSH_MASTER_URL_RE = re.compile(r'^(?:ssh://git@([^/:@]+)/|git@([^/:@]+):)')
+
+# git stderr classification (case-insensitive, no lowercased copy needed)
+GIT_AUTH_ERROR_RE = re.compile(r'permission denied|authentication failed|could not read username', re.I)
+GIT_MISSING_ERROR_RE = re.compile(r'not found|could not read|does not appear', re.I)
+GIT_MOVED_ERROR_RE = re.compile(r'repository not found|does not appear', re.I)
+
+def get_git_probe_cache_path() -> str:
+    """Get path to the git probe cache (url -> last ls-remote outcome)"""
+    return get_cache_file_path("git_probe.json")
+
+def is_fresh_probe_entry(entry, now: float) -> bool:
+    """True for a well-formed cache entry still within its TTL"""
+    if not isinstance(entry, dict):
+        return False
+    returncode, stderr, ts = entry.get('returncode'), entry.get('stderr'), entry.get('ts')
+    if not isinstance(returncode, int) or not isinstance(stderr, str) or not isinstance(ts, (int, float)):
+        return False
+    ttl = GIT_PROBE_CACHE_TTL_OK if returncode == 0 else GIT_PROBE_CACHE_TTL_FAILED
+    return now - ts < ttl
+
+def load_git_probe_cache(now: Optional[float] = None) -> dict:
+    """Load fresh cached git probe outcomes, or an empty mapping if unavailable
+
+    Malformed and expired entries are dropped here, so they count as cache
+    misses and are pruned from the file on the next save.
+    """
+    cache_path = get_git_probe_cache_path()
+    if not Path(cache_path).exists():
+        return {}
+    try:
+        with open(cache_path, 'r') as f:
+            cache = json.load(f)
+    except (json.JSONDecodeError, IOError):
+        return {}
+    if not isinstance(cache, dict):
+        return {}
+    now = time.time() if now is None else now
+    return {url: entry for url, entry in cache.items() if is_fresh_probe_entry(entry, now)}
+
+def save_git_probe_cache(cache: dict):
+    """Atomically save git probe outcomes (unique temp file, then os.replace)"""
+    cache_path = get_git_probe_cache_path()
+    try:
+        # mkstemp so concurrent runs never share (and clobber) one temp file
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), prefix=".git_probe.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(cache, f, indent=2)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except IOError as e:
+        print(f"{Colors.YELLOW}⚠️  Could not save git probe cache: {e}{Colors.END}")
+
+def get_git_url_host(git_url: str) -> str:
+    """Extract the host from https://, ssh:// or scp-style (git@host:path) URLs"""
+    match = GIT_URL_HOST_RE.match(git_url)
+    return match.group(1) if match else ""
+
+def is_cacheable_probe_result(result) -> bool:
+    """True for outcomes worth replaying: accessible, auth-required or not-found.
+
+    Anything else (DNS/network hiccups land in the generic ERROR class) is
+    re-probed next run rather than trusted for an hour.
+    """
+    if not isinstance(result, subprocess.CompletedProcess):
+        return False
+    return (result.returncode == 0 or bool(GIT_AUTH_ERROR_RE.search(result.stderr))
+            or bool(GIT_MISSING_ERROR_RE.search(result.stderr)))
+
+def get_ssh_master_key(git_url: str) -> Optional[str]:
+    """Host alias whose shared git@ master this URL would reuse, or None"""
+    match = GIT_SSH_MASTER_URL_RE.match(git_url)
+    return (match.group(1) or match.group(2)) if match else None
+
+def iter_git_probe_results(git_urls: List[str], use_cache: bool = True) -> Iterator[Tuple[str, object, bool]]:
+    """Probe git URLs concurrently, yielding (url, result, cached) as each completes.
+
+    Results are probe_git_url() outcomes. Fresh cached outcomes are replayed
+    without touching the network (unless use_cache is False) and flagged
+    cached, and once a host times out, remaining URLs on that host are
+    reported as timeouts without being probed. New cacheable outcomes are
+    written back to the cache. Hosts with several SSH URLs get a shared
+    master connection for the duration.
+    """
+    if not git_urls:
+        return
+
+    # Only hosts with a master get the multiplexing ssh command; the rest
+    # (and users with their own GIT_SSH/core.sshCommand) use git's defaults
+    git_env = {**os.environ, 'GIT_TERMINAL_PROMPT': '0'}
+    master_env = {**get_git_ssh_env(), 'GIT_TERMINAL_PROMPT': '0'}
+    use_masters = 'GIT_SSH_COMMAND' in master_env and 'GIT_SSH_COMMAND' not in os.environ
+    now = time.time()
+    probe_cache = load_git_probe_cache(now)
+    bad_hosts = set()
+
+    def cached_result(url):
+        # Entries were validated and TTL-checked by load_git_probe_cache
+        entry = probe_cache.get(url)
+        if use_cache and entry:
+            result = subprocess.CompletedProcess(['git', 'ls-remote', url], entry['returncode'], '', entry['stderr'])
+            # Entries written before ERROR outcomes stopped being cached are ignored
+            if is_cacheable_probe_result(result):
+                return result
+        return None
+
+    def probe(url):
+        cached = cached_result(url)
+        if cached is not None:
+            return cached, False, True
+
+        host = get_git_url_host(url)
+        if host and host in bad_hosts:
+            return subprocess.TimeoutExpired(['git', 'ls-remote', url], 3), False, False
+
+        result = probe_git_url(url, master_env if get_ssh_master_key(url) in master_hosts else git_env)
+        if isinstance(result, subprocess.TimeoutExpired) and host:
+            bad_hosts.add(host)
+        return result, True, False
+
+    # Aliases with several SSH URLs still to probe share one handshake instead of
+    # one per probe; keyed exactly like the ControlPath, so each master is distinct
+    ssh_host_counts = Counter(get_ssh_master_key(url) for url in git_urls if cached_result(url) is None)
+    shared_hosts = [host for host, count in ssh_host_counts.items() if host and count > 1] if use_masters else []
+    master_hosts = set()
+
+    updated = False
+    with ThreadPoolExecutor(max_workers=min(GIT_PROBE_MAX_WORKERS, len(git_urls))) as executor:
+        started = executor.map(lambda host: start_ssh_master(host, timeout=3, batch_mode=True), shared_hosts)
+        master_hosts.update(host for host, ok in zip(shared_hosts, started) if ok)
+        try:
+            futures = {executor.submit(probe, url): url for url in git_urls}
+            for future in as_completed(futures):
+                url = futures[future]
+                result, fresh, cached = future.result()
+                if fresh and is_cacheable_probe_result(result):
+                    probe_cache[url] = {'returncode': result.returncode, 'stderr': result.stderr, 'ts': now}
+                    updated = True
+                yield url, result, cached
+        finally:
+            for host in master_hosts:
+                stop_ssh_master(host)
+
+    if updated:
+        save_git_probe_cache(probe_cache)
+
+# HTTPS -> SSH rewrite for scan-git fix-urls (applied to raw bytes)
+SSH_FIX_RE = re.compile(rb'https://(github\.com|gitlab\.com)/')
+
+def convert_https_git_urls_to_ssh(cargo_path: Path, dry_run: bool = False) -> bool:
+    """Rewrite GitHub/GitLab HTTPS URLs in a Cargo.toml to ssh://git@ form.
+
+    The file is mmap'd and searched in place first, so files with nothing to
+    convert are never copied into memory or written. Returns True if the
+    file contained URLs to convert.
+    """
+    with open(cargo_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return False
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if SSH_FIX_RE.search(mm) is None:
+                return False
+            data = mm[:]
+    new_data = SSH_FIX_RE.sub(rb'ssh://git@\1/', data)
+    if not dry_run:
+        cargo_path.write_bytes(new_data)
+    return True
+
+def find_cargo_files_with_https_git_urls(root_dir) -> Optional[Set[str]]:
+    """Find Cargo.toml files under root_dir containing GitHub/GitLab HTTPS URLs.
+
+    One ripgrep pass over the tree instead of opening every manifest from
+    Python. Returns normalized paths, or None when rg is unavailable or
+    fails (callers then check every file themselves).
+    """
+    rg = shutil.which('rg')
+    if not rg:
+        return None
+    # Prune the same directories as iter_cargo_files so rg never walks target/.git/node_modules
+    exclude_globs = [arg for name in sorted(CARGO_SCAN_EXCLUDED_DIRS) for arg in ('--glob', f'!{name}/')]
+    try:
+        result = subprocess.run(
+            [rg, '--files-with-matches', '--null', '--no-ignore', '--hidden', '--no-messages',
+             '--glob', 'Cargo.toml', *exclude_globs, '-e', r'https://(github|gitlab)\.com/', str(root_dir)],
+            capture_output=True,
+            timeout=60
+        )
+    except (subprocess.TimeoutExpired, OSError):
+        return None
+    # 0 = matches, 1 = no matches, anything else = error (results may be partial)
+    if result.returncode not in (0, 1):
+        return None
+    return {os.path.normpath(os.fsdecode(p)) for p in result.stdout.split(b'\0') if p}
+
 def scan_git_dependencies(args=None):
     """Scan all Cargo.toml files for git dependencies and test accessibility"""
-    import subprocess
-    from pathlib import Path
 
     fix_urls = args and args.package == 'fix-urls'
     dry_run = args and args.dry_run
 
+    # Probe lines stream as they complete; line buffering keeps that true when
+    # stdout is a pipe (blade scan-git | tee) without per-print flushes
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(line_buffering=True)
+
     print(f"{Colors.CYAN}{Colors.BOLD}🔍 Git Dependency Scanner{Colors.END}")
     print(f"{Colors.GRAY}Scanning for git dependencies and testing accessibility...{Colors.END}")
     if fix_urls:
@@ -5570,6 +6207,13 @@ def scan_git_dependencies(args=None):
         print(f"{Colors.RED}❌ RUST_REPO_ROOT not set{Colors.END}")
         return
 
+    root_prefix = os.path.join(RUST_REPO_ROOT, '')  # stringified once, with trailing separator
+
+    def display_path(cargo_path):
+        """Cargo.toml path relative to RUST_REPO_ROOT for output (prefix slice, no resolve)"""
+        path_str = str(cargo_path)
+        return path_str[len(root_prefix):] if path_str.startswith(root_prefix) else path_str
+
     # Find all Cargo.toml files (using find_all_cargo_files_fast to respect exclusions)
     cargo_files = find_all_cargo_files_fast()
     print(f"Found {len(cargo_files)} Cargo.toml files (excluding bak/dev/archive/howto/ref)")
@@ -5577,13 +6221,13 @@ def scan_git_dependencies(args=None):
 
     git_deps = {}  # {git_url: [(cargo_file, dep_name, ref)]}
     broken_deps = []
-    https_deps = []
-    ssh_deps = []
+    https_deps = {}  # {git_url: first ref seen} - dict keeps order with O(1) dedup
+    ssh_deps = {}
 
     # Scan all Cargo.toml files for git dependencies
     for cargo_path in cargo_files:
         try:
-            cargo_data = load_toml(cargo_path)
+            cargo_data = load_toml_cached(cargo_path)
 
             for section in ['dependencies', 'dev-dependencies']:
                 if section in cargo_data:
@@ -5598,11 +6242,9 @@ def scan_git_dependencies(args=None):
 
                             # Categorize by URL type
                             if git_url.startswith('https://'):
-                                if git_url not in [d[0] for d in https_deps]:
-                                    https_deps.append((git_url, git_ref))
+                                https_deps.setdefault(git_url, git_ref)
                             elif git_url.startswith('ssh://') or git_url.startswith('git@'):
-                                if git_url not in [d[0] for d in ssh_deps]:
-                                    ssh_deps.append((git_url, git_ref))
+                                ssh_deps.setdefault(git_url, git_ref)
         except Exception as e:
             print(f"{Colors.YELLOW}⚠️  Could not parse {cargo_path}: {e}{Colors.END}")
 
@@ -5621,91 +6263,96 @@ def scan_git_dependencies(args=None):
     not_found = []
     timeouts = []
 
-    for git_url in git_deps.keys():
-        print(f"Testing: {git_url}... ", end='', flush=True)
+    # Probe every unique URL concurrently - each probe is network-bound
+    # (--live bypasses the probe cache). Results stream out as they complete.
+    git_urls = list(git_deps.keys())
+    use_probe_cache = not (args and args.live)
+    print(f"{Colors.GRAY}Probing {len(git_urls)} repos...{Colors.END}")
 
-        try:
-            # Set environment to block prompts
-            git_env = {**os.environ, 'GIT_TERMINAL_PROMPT': '0'}
+    cached_count = 0
 
-            result = subprocess.run(
-                ['git', 'ls-remote', '--heads', git_url],
-                capture_output=True,
-                text=True,
-                timeout=3,
-                env=git_env,
-                stdin=subprocess.DEVNULL
-            )
-
-            if result.returncode == 0:
-                print(f"{Colors.GREEN}✓ accessible{Colors.END}")
-                accessible.append(git_url)
-            else:
-                error_msg = result.stderr.lower()
-                if 'permission denied' in error_msg or 'authentication failed' in error_msg or 'could not read username' in error_msg:
-                    print(f"{Colors.YELLOW}⚠ AUTH_REQUIRED{Colors.END}")
-                    needs_auth.append((git_url, result.stderr.strip()[:100]))
-                elif 'not found' in error_msg or 'could not read' in error_msg or 'does not appear' in error_msg:
-                    print(f"{Colors.RED}✗ NOT_FOUND{Colors.END}")
-                    not_found.append((git_url, result.stderr.strip()[:100]))
-                else:
-                    print(f"{Colors.RED}✗ ERROR{Colors.END}")
-                    not_found.append((git_url, result.stderr.strip()[:100]))
-        except subprocess.TimeoutExpired:
-            print(f"{Colors.ORANGE}⏱ TIMEOUT{Colors.END}")
+    for git_url, result, cached in iter_git_probe_results(git_urls, use_cache=use_probe_cache):
+        if isinstance(result, subprocess.TimeoutExpired):
+            status = f"{Colors.ORANGE}⏱ TIMEOUT{Colors.END}"
             timeouts.append(git_url)
-        except Exception as e:
-            print(f"{Colors.RED}✗ {str(e)[:50]}{Colors.END}")
-
-    print()
-    print(f"{Colors.CYAN}{Colors.BOLD}📋 Results Summary:{Colors.END}")
-    print()
+        elif isinstance(result, Exception):
+            status = f"{Colors.RED}✗ {str(result)[:50]}{Colors.END}"
+        elif result.returncode == 0:
+            status = f"{Colors.GREEN}✓ accessible{Colors.END}"
+            accessible.append(git_url)
+        else:
+            if GIT_AUTH_ERROR_RE.search(result.stderr):
+                status = f"{Colors.YELLOW}⚠ AUTH_REQUIRED{Colors.END}"
+                needs_auth.append((git_url, result.stderr.strip()[:100]))
+            elif GIT_MISSING_ERROR_RE.search(result.stderr):
+                status = f"{Colors.RED}✗ NOT_FOUND{Colors.END}"
+                not_found.append((git_url, result.stderr.strip()[:100]))
+            else:
+                status = f"{Colors.RED}✗ ERROR{Colors.END}"
+                not_found.append((git_url, result.stderr.strip()[:100]))
+
+        if cached:
+            cached_count += 1
+            status += f" {Colors.GRAY}(cached){Colors.END}"
+
+        print(f"Testing: {git_url}... {status}")
+
+    # Summary lists follow scan order, not completion order
+    scan_order = {url: i for i, url in enumerate(git_urls)}
+    accessible.sort(key=scan_order.__getitem__)
+    timeouts.sort(key=scan_order.__getitem__)
+    needs_auth.sort(key=lambda item: scan_order[item[0]])
+    not_found.sort(key=lambda item: scan_order[item[0]])
+
+    # Build the summary in memory and emit it with a single write
+    out = io.StringIO()
+
+    def write_uses(url, limit=3):
+        uses = git_deps[url]
+        out.write(f"    Used in {len(uses)} files:\n")
+        for cargo_path, dep_name, ref in uses[:limit]:
+            rel_path = display_path(cargo_path)
+            out.write(f"      - {rel_path} ({dep_name})\n")
+        if len(uses) > limit:
+            out.write(f"      ... and {len(uses) - limit} more\n")
+
+    out.write(f"\n{Colors.CYAN}{Colors.BOLD}📋 Results Summary:{Colors.END}\n\n")
+    if cached_count:
+        out.write(f"{Colors.GRAY}{cached_count} result(s) replayed from the probe cache - "
+                  f"run 'blade scan-git --live' to re-test after fixing access{Colors.END}\n\n")
 
     if accessible:
-        print(f"{Colors.GREEN}✓ Accessible ({len(accessible)}):{Colors.END}")
+        out.write(f"{Colors.GREEN}✓ Accessible ({len(accessible)}):{Colors.END}\n")
         for url in accessible:
-            print(f"  {url}")
-        print()
+            out.write(f"  {url}\n")
+        out.write("\n")
 
     if needs_auth:
-        print(f"{Colors.YELLOW}⚠ Requires Authentication ({len(needs_auth)}):{Colors.END}")
+        out.write(f"{Colors.YELLOW}⚠ Requires Authentication ({len(needs_auth)}):{Colors.END}\n")
         for url, _ in needs_auth:
-            uses = git_deps[url]
-            print(f"  {url}")
-            print(f"    Used in {len(uses)} files:")
-            for cargo_path, dep_name, ref in uses[:3]:  # Show first 3
-                rel_path = str(cargo_path).replace(str(RUST_REPO_ROOT) + '/', '')
-                print(f"      - {rel_path} ({dep_name})")
-            if len(uses) > 3:
-                print(f"      ... and {len(uses) - 3} more")
-        print()
-        print(f"{Colors.CYAN}💡 Fix: Run 'blade fix-git' to configure cargo for SSH authentication{Colors.END}")
-        print()
+            out.write(f"  {url}\n")
+            write_uses(url)
+        out.write("\n")
+        out.write(f"{Colors.CYAN}💡 Fix: Run 'blade fix-git' to configure cargo for SSH authentication{Colors.END}\n\n")
 
     if not_found:
-        print(f"{Colors.RED}✗ Not Found / Moved ({len(not_found)}):{Colors.END}")
+        out.write(f"{Colors.RED}✗ Not Found / Moved ({len(not_found)}):{Colors.END}\n")
         for url, error in not_found:
-            uses = git_deps[url]
-            print(f"  {url}")
-            if 'repository not found' in error.lower() or 'does not appear' in error.lower():
-                print(f"    {Colors.GRAY}└─ Repo may have been moved or deleted{Colors.END}")
-            print(f"    Used in {len(uses)} files:")
-            for cargo_path, dep_name, ref in uses[:3]:
-                rel_path = str(cargo_path).replace(str(RUST_REPO_ROOT) + '/', '')
-                print(f"      - {rel_path} ({dep_name})")
-            if len(uses) > 3:
-                print(f"      ... and {len(uses) - 3} more")
-        print()
-        print(f"{Colors.CYAN}💡 Fix: Update Cargo.toml files with correct git URLs (e.g., migrated to GitLab){Colors.END}")
-        print()
+            out.write(f"  {url}\n")
+            if GIT_MOVED_ERROR_RE.search(error):
+                out.write(f"    {Colors.GRAY}└─ Repo may have been moved or deleted{Colors.END}\n")
+            write_uses(url)
+        out.write("\n")
+        out.write(f"{Colors.CYAN}💡 Fix: Update Cargo.toml files with correct git URLs (e.g., migrated to GitLab){Colors.END}\n\n")
 
     if timeouts:
-        print(f"{Colors.ORANGE}⏱ Timed Out ({len(timeouts)}):{Colors.END}")
+        out.write(f"{Colors.ORANGE}⏱ Timed Out ({len(timeouts)}):{Colors.END}\n")
         for url in timeouts:
-            uses = git_deps[url]
-            print(f"  {url}")
-            print(f"    Used in {len(uses)} file(s)")
-        print()
+            out.write(f"  {url}\n")
+            out.write(f"    Used in {len(git_deps[url])} file(s)\n")
+        out.write("\n")
+
+    sys.stdout.write(out.getvalue())
 
     # Auto-fix HTTPS URLs to SSH if requested
     if fix_urls and (needs_auth or https_deps):
@@ -5713,39 +6360,36 @@ def scan_git_dependencies(args=None):
         print(f"{Colors.CYAN}{Colors.BOLD}🔧 Auto-fixing HTTPS URLs to SSH:{Colors.END}")
         print()
 
-        fixed_count = 0
-        for cargo_path in cargo_files:
-            try:
-                with open(cargo_path, 'r') as f:
-                    content = f.read()
-
-                modified = False
-                new_content = content
+        # Narrow to affected manifests with one rg pass when available
+        affected = find_cargo_files_with_https_git_urls(RUST_REPO_ROOT)
+        if affected is None:
+            candidates = cargo_files
+        else:
+            candidates = [p for p in cargo_files if os.path.normpath(str(p)) in affected]
 
-                # Convert common HTTPS patterns to SSH
-                replacements = [
-                    ('https://github.com/', 'ssh://git@github.com/'),
-                    ('https://gitlab.com/', 'ssh://git@gitlab.com/'),
-                ]
+        fixed_count = 0
+        out = io.StringIO()
+        # Files are independent, so read/rewrite them concurrently; report in scan order
+        with ThreadPoolExecutor(max_workers=max(1, min(GIT_PROBE_MAX_WORKERS, len(candidates)))) as executor:
+            futures = [executor.submit(convert_https_git_urls_to_ssh, Path(cargo_path), dry_run)
+                       for cargo_path in candidates]
 
-                for old, new in replacements:
-                    if old in new_content:
-                        new_content = new_content.replace(old, new)
-                        modified = True
+            for cargo_path, future in zip(candidates, futures):
+                try:
+                    modified = future.result()
+                except Exception as e:
+                    out.write(f"{Colors.RED}✗ Error processing {cargo_path}: {e}{Colors.END}\n")
+                    continue
 
                 if modified:
-                    rel_path = str(cargo_path).replace(str(RUST_REPO_ROOT) + '/', '')
+                    rel_path = display_path(cargo_path)
                     if dry_run:
-                        print(f"{Colors.YELLOW}Would update: {rel_path}{Colors.END}")
+                        out.write(f"{Colors.YELLOW}Would update: {rel_path}{Colors.END}\n")
                     else:
-                        with open(cargo_path, 'w') as f:
-                            f.write(new_content)
-                        print(f"{Colors.GREEN}✓ Updated: {rel_path}{Colors.END}")
+                        out.write(f"{Colors.GREEN}✓ Updated: {rel_path}{Colors.END}\n")
                     fixed_count += 1
 
-            except Exception as e:
-                print(f"{Colors.RED}✗ Error processing {cargo_path}: {e}{Colors.END}")
-
+        sys.stdout.write(out.getvalue())
         print()
         if dry_run:
             print(f"{Colors.YELLOW}Dry run: Would fix {fixed_count} files{Colors.END}")
@@ -5765,22 +6409,41 @@ def scan_git_dependencies(args=None):
     if not not_found and not needs_auth:
         print(f"{Colors.GREEN}✓ All git dependencies are accessible!{Colors.END}")
 
+# User config files fix-git inspects/edits (home doesn't change during a run)
+HOME_DIR = Path.home()
+CARGO_CONFIG_PATH = HOME_DIR / ".cargo" / "config.toml"
+CARGO_CONFIG_DIR = CARGO_CONFIG_PATH.parent
+SSH_CONFIG_PATH = HOME_DIR / ".ssh" / "config"
+
+# [net] table header line in ~/.cargo/config.toml (trailing comment allowed);
+# group 2 keeps a CRLF file's '\r' so the inserted line matches its endings
+CARGO_NET_SECTION_RE = re.compile(r'^([ \t]*\[net\][ \t]*(?:#[^\r\n]*)?)(\r?)$', re.MULTILINE)
+# Forge hosts fix-git looks for in ~/.ssh/config
+SSH_CONFIG_FORGE_RE = re.compile(r'git(?:lab|hub)\.com', re.IGNORECASE)
+
+def add_git_fetch_with_cli(config_text: str) -> Tuple[str, bool]:
+    """Add git-fetch-with-cli = true to cargo config text
+
+    Inserts the setting directly under an existing [net] header, else appends
+    the section. Returns (new_text, True if an existing [net] was reused).
+    """
+    new_config, added = CARGO_NET_SECTION_RE.subn(r'\1\2\ngit-fetch-with-cli = true\2', config_text, count=1)
+    if added:
+        return new_config, True
+    newline = '\r\n' if '\r\n' in config_text else '\n'
+    return config_text + f"{newline}[net]{newline}git-fetch-with-cli = true{newline}", False
+
 def fix_git_config(args):
     """Fix cargo config for private git dependencies"""
-    import subprocess
-    from pathlib import Path
 
     print(f"{Colors.CYAN}{Colors.BOLD}🔧 Git Dependency Configuration Fixer{Colors.END}")
     print()
 
-    cargo_config_path = Path.home() / ".cargo" / "config.toml"
-    cargo_config_dir = Path.home() / ".cargo"
-
     # Check current status
     has_git_fetch_cli = False
-    if cargo_config_path.exists():
+    if CARGO_CONFIG_PATH.exists():
         try:
-            config = load_toml(cargo_config_path)
+            config = load_toml(CARGO_CONFIG_PATH)
             net_section = config.get('net', {})
             has_git_fetch_cli = net_section.get('git-fetch-with-cli') == True
         except:
@@ -5788,14 +6451,14 @@ def fix_git_config(args):
 
     if has_git_fetch_cli:
         print(f"{Colors.GREEN}✓ Cargo is already configured for private git dependencies{Colors.END}")
-        print(f"  git-fetch-with-cli = true is set in {cargo_config_path}")
+        print(f"  git-fetch-with-cli = true is set in {CARGO_CONFIG_PATH}")
     else:
         print(f"{Colors.YELLOW}⚠️  Cargo is not configured for private git dependencies{Colors.END}")
         print(f"  Missing: git-fetch-with-cli = true in [net] section")
         print()
 
         if args.dry_run:
-            print(f"{Colors.CYAN}Would add to {cargo_config_path}:{Colors.END}")
+            print(f"{Colors.CYAN}Would add to {CARGO_CONFIG_PATH}:{Colors.END}")
             print(f"{Colors.WHITE}[net]{Colors.END}")
             print(f"{Colors.WHITE}git-fetch-with-cli = true{Colors.END}")
             print()
@@ -5804,48 +6467,37 @@ def fix_git_config(args):
 
         # Fix it
         try:
-            cargo_config_dir.mkdir(parents=True, exist_ok=True)
+            CARGO_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
-            # Read existing config
+            # Read existing config (newline='' keeps CRLF endings as they are)
             existing_config = ""
-            if cargo_config_path.exists():
-                with open(cargo_config_path, 'r') as f:
+            if CARGO_CONFIG_PATH.exists():
+                with open(CARGO_CONFIG_PATH, 'r', newline='') as f:
                     existing_config = f.read()
 
-            # Check if [net] section exists
-            has_net_section = '[net]' in existing_config
-
-            if not has_net_section:
-                # Add entire [net] section
-                with open(cargo_config_path, 'a') as f:
-                    f.write("\n[net]\ngit-fetch-with-cli = true\n")
-                print(f"{Colors.GREEN}✓ Added [net] section with git-fetch-with-cli = true{Colors.END}")
-            else:
-                # Add just the setting to existing [net] section
-                lines = existing_config.split('\n')
-                new_lines = []
-                in_net_section = False
-                added = False
-
-                for line in lines:
-                    new_lines.append(line)
-                    if line.strip() == '[net]':
-                        in_net_section = True
-                    elif in_net_section and line.strip().startswith('['):
-                        if not added:
-                            new_lines.insert(-1, 'git-fetch-with-cli = true')
-                            added = True
-                        in_net_section = False
-
-                if in_net_section and not added:
-                    new_lines.append('git-fetch-with-cli = true')
-
-                with open(cargo_config_path, 'w') as f:
-                    f.write('\n'.join(new_lines))
+            new_config, added = add_git_fetch_with_cli(existing_config)
 
+            # Write temp file then os.replace so a crash never leaves a half-written config
+            # (resolved so a symlinked dotfile is updated rather than replaced)
+            target_path = CARGO_CONFIG_PATH.resolve()
+            fd, tmp_path = tempfile.mkstemp(dir=target_path.parent, prefix=f".{target_path.name}.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w', newline='') as f:
+                    f.write(new_config)
+                # mkstemp creates 0600; keep the existing file's mode (it may hold registry tokens)
+                if target_path.exists():
+                    shutil.copymode(target_path, tmp_path)
+                os.replace(tmp_path, target_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+
+            if added:
                 print(f"{Colors.GREEN}✓ Added git-fetch-with-cli = true to [net] section{Colors.END}")
+            else:
+                print(f"{Colors.GREEN}✓ Added [net] section with git-fetch-with-cli = true{Colors.END}")
 
-            print(f"\n{Colors.GREEN}✅ Cargo config updated: {cargo_config_path}{Colors.END}")
+            print(f"\n{Colors.GREEN}✅ Cargo config updated: {CARGO_CONFIG_PATH}{Colors.END}")
             print(f"   Git dependencies will now use system git with SSH auth")
 
         except Exception as e:
@@ -5855,16 +6507,16 @@ def fix_git_config(args):
     # Check for SSH config
     print()
     print(f"{Colors.CYAN}📋 SSH Configuration:{Colors.END}")
-    ssh_config_path = Path.home() / ".ssh" / "config"
 
-    if ssh_config_path.exists():
+    if SSH_CONFIG_PATH.exists():
         try:
-            with open(ssh_config_path, 'r') as f:
+            with open(SSH_CONFIG_PATH, 'r') as f:
                 ssh_content = f.read()
 
-            # Look for GitLab and GitHub entries
-            has_gitlab = 'gitlab.com' in ssh_content.lower()
-            has_github = 'github.com' in ssh_content.lower()
+            # Look for GitLab and GitHub entries (one case-insensitive pass)
+            forges = {m.group(0).lower() for m in SSH_CONFIG_FORGE_RE.finditer(ssh_content)}
+            has_gitlab = 'gitlab.com' in forges
+            has_github = 'github.com' in forges
 
             if has_gitlab:
                 print(f"{Colors.GREEN}✓ GitLab SSH profile found{Colors.END}")
@@ -5892,7 +6544,77 @@ def fix_git_config(args):
     print(f"   {Colors.WHITE}rsb = {{ git = \"ssh://git@gitlab.com/oodx/rsb.git\", branch = \"main\" }}{Colors.END}")
     print(f"4. Restart any running cargo processes")
 
-def main():
+# ============================================================================
+# Command Dispatch
+# ============================================================================
+
+def _learn_command(ecosystem: EcosystemData, args) -> None:
+    if args.package.lower() == 'all':
+        learn_all_opportunities(ecosystem)
+    else:
+        learn_package(ecosystem, args.package)
+
+# Views over the hydrated TSV cache: name -> handler(ecosystem)
+ECOSYSTEM_COMMANDS = {
+    'repos': view_repos,
+    'conflicts': view_conflicts,
+    'usage': view_usage,
+    'u': view_usage,
+    'q': view_usage,
+    'review': view_review,
+    'hub': view_hub_dashboard,
+    'stats': view_stats,
+    'outdated': view_outdated,
+}
+
+# Views that need a package/repo argument: name -> (handler(ecosystem, args), error, usage lines)
+ARG_COMMANDS = {
+    'update': (lambda ecosystem, args: update_repo_dependencies(ecosystem, args.package, dry_run=args.dry_run,
+                                                                force_commit=args.force_commit, force=args.force),
+               "Repository name required for update command",
+               ["repos.py update <repo-name> [--dry-run] [--force-commit] [--force]"]),
+    'eco': (lambda ecosystem, args: update_ecosystem(ecosystem, dry_run=args.dry_run,
+                                                     force_commit=args.force_commit, force=args.force),
+            None, []),
+    'pkg': (lambda ecosystem, args: view_package_detail(ecosystem, args.package),
+            "Package name required for pkg command",
+            ["repos.py pkg <package-name>"]),
+    'deps': (lambda ecosystem, args: view_repo_deps(ecosystem, args.package),
+             "Repository name required for deps command",
+             ["repos.py deps <repo-name>"]),
+    'search': (lambda ecosystem, args: view_search(ecosystem, args.package),
+               "Search pattern required for search command",
+               ["repos.py search <pattern>"]),
+    'graph': (lambda ecosystem, args: view_graph(ecosystem, args.package),
+              "Package name required for graph command",
+              ["repos.py graph <package-name>"]),
+    'learn': (_learn_command,
+              "Package name or 'all' required for learn command",
+              ["repos.py learn <package-name>  # Learn a specific package",
+               "       repos.py learn all              # Learn all opportunities"]),
+    'notes': (lambda ecosystem, args: view_repo_notes(ecosystem, args.package, create_if_missing=args.create),
+              "Repository name required for notes command",
+              ["repos.py notes <repo-name>           # View hub metadata/notes",
+               "       repos.py notes <repo-name> --create  # Create metadata section if missing"]),
+}
+
+# Commands that work from the filesystem/network rather than the TSV cache: name -> handler(args)
+UTILITY_COMMANDS = {
+    'data': lambda args: generate_data_cache(analyze_dependencies(), args.fast_mode),
+    'export': lambda args: export_raw_data(analyze_dependencies()),
+    'superclean': lambda args: superclean_targets(),
+    'ls': lambda args: list_repositories(force_live=args.live),
+    'legacy': lambda args: analyze_package_usage(analyze_dependencies()),  # Backwards compatibility
+    'fix-git': fix_git_config,
+    'scan-git': scan_git_dependencies,
+}
+
+# Commands that run spinners (cursor hidden, raw terminal) or long subprocess work;
+# everything else exits fine through the default KeyboardInterrupt path
+SIGNAL_HANDLED_COMMANDS = frozenset({'data', 'export', 'superclean', 'update', 'eco', 'scan-git'})
+
+def install_signal_handlers():
+    """Install handlers that restore the terminal before exiting on Ctrl+C/Ctrl+Z/TERM"""
     def signal_handler(signum, frame):
         """Global signal handler for graceful exit"""
         # Restore cursor visibility before exit
@@ -5908,11 +6630,11 @@ def main():
         print(f"\n{Colors.YELLOW}⚠️  Operation interrupted by user{Colors.END}")
         sys.exit(0)
 
-    # Setup global signal handlers
     signal.signal(signal.SIGINT, signal_handler)  # Ctrl+C
     signal.signal(signal.SIGTERM, signal_handler)  # Termination
     signal.signal(signal.SIGTSTP, signal_handler)  # Ctrl+Z
 
+def main():
     parser = argparse.ArgumentParser(
         prog='blade',
         description='🗡️  BLADE - Advanced Dependency Management for Rust Ecosystems',
@@ -5960,7 +6682,7 @@ FLAGS:
   --dry-run           Preview changes without applying
   --force-commit      Auto-commit with 'auto:hub bump' message
   --force             Bypass safety checks (use with caution)
-  --live              Force live discovery (ignore cache)
+  --live              Force live discovery/git probes (ignore cache)
   --create            Create hub metadata section (for notes)
   --ssh-profile       SSH profile for git operations
 
@@ -5974,12 +6696,11 @@ EXAMPLES:
 
     parser.add_argument('--version', action=VersionAction, nargs=0)
     parser.add_argument('command', nargs='?', default='conflicts',
-                       choices=['repos', 'conflicts', 'usage', 'u', 'q', 'review', 'hub', 'update', 'eco', 'pkg', 'export', 'data', 'superclean', 'ls', 'legacy',
-                               'stats', 'deps', 'outdated', 'search', 'graph', 'learn', 'notes', 'fix-git', 'scan-git', 'latest'],
+                       choices=[*ECOSYSTEM_COMMANDS, *ARG_COMMANDS, *UTILITY_COMMANDS, 'latest'],
                        help='Command to run (see categories below)')
     parser.add_argument('package', nargs='?', help='Package/repo name for specific commands')
     parser.add_argument('--ssh-profile', default=None, help='SSH profile/host for git operations')
-    parser.add_argument('--live', action='store_true', help='Force live discovery instead of cache')
+    parser.add_argument('--live', action='store_true', help='Force live discovery/probing instead of cache')
     parser.add_argument('--fast-mode', action='store_true', help='Disable progress bars and interactive elements')
     parser.add_argument('--dry-run', action='store_true', help='Show what would be updated without making changes')
     parser.add_argument('--force-commit', action='store_true', help='Automatically commit changes')
@@ -5988,6 +6709,9 @@ EXAMPLES:
 
     args = parser.parse_args()
 
+    if args.command in SIGNAL_HANDLED_COMMANDS:
+        install_signal_handlers()
+
     try:
         if args.command == 'latest':
             if not args.package:
@@ -5997,85 +6721,25 @@ EXAMPLES:
             check_latest(args.package)
             return
 
-        # For other commands, we need to analyze dependencies first
-        dependencies = analyze_dependencies()
-
         # Fast view commands (primary interface)
-        if args.command in ['conflicts', 'usage', 'u', 'q', 'review', 'hub', 'update', 'eco', 'pkg', 'stats', 'deps', 'outdated', 'search', 'graph', 'learn', 'notes']:
+        if args.command in ECOSYSTEM_COMMANDS or args.command in ARG_COMMANDS:
             try:
+                if args.command in ARG_COMMANDS:
+                    handler, missing_error, usage_lines = ARG_COMMANDS[args.command]
+                    if missing_error and not args.package:
+                        print(f"{Colors.RED}❌ {missing_error}{Colors.END}")
+                        print(f"Usage: {usage_lines[0]}")
+                        for line in usage_lines[1:]:
+                            print(line)
+                        return
+
                 ecosystem = hydrate_tsv_cache()
                 print(f"✅ Hydration successful: {len(ecosystem.deps)} deps, {len(ecosystem.repos)} repos")
 
-                if args.command == 'repos':
-                    view_repos(ecosystem)
-                elif args.command == 'conflicts':
-                    view_conflicts(ecosystem)
-                elif args.command in ['usage', 'u', 'q']:
-                    view_usage(ecosystem)
-                elif args.command == 'review':
-                    view_review(ecosystem)
-                elif args.command == 'hub':
-                    view_hub_dashboard(ecosystem)
-                elif args.command == 'update':
-                    if args.package:
-                        update_repo_dependencies(ecosystem, args.package, dry_run=args.dry_run, force_commit=args.force_commit, force=args.force)
-                    else:
-                        print(f"{Colors.RED}❌ Repository name required for update command{Colors.END}")
-                        print(f"Usage: repos.py update <repo-name> [--dry-run] [--force-commit] [--force]")
-                        return
-                elif args.command == 'eco':
-                    update_ecosystem(ecosystem, dry_run=args.dry_run, force_commit=args.force_commit, force=args.force)
-                elif args.command == 'pkg':
-                    if args.package:
-                        view_package_detail(ecosystem, args.package)
-                    else:
-                        print(f"{Colors.RED}❌ Package name required for pkg command{Colors.END}")
-                        print(f"Usage: repos.py pkg <package-name>")
-                        return
-                elif args.command == 'stats':
-                    view_stats(ecosystem)
-                elif args.command == 'deps':
-                    if args.package:
-                        view_repo_deps(ecosystem, args.package)
-                    else:
-                        print(f"{Colors.RED}❌ Repository name required for deps command{Colors.END}")
-                        print(f"Usage: repos.py deps <repo-name>")
-                        return
-                elif args.command == 'outdated':
-                    view_outdated(ecosystem)
-                elif args.command == 'search':
-                    if args.package:
-                        view_search(ecosystem, args.package)
-                    else:
-                        print(f"{Colors.RED}❌ Search pattern required for search command{Colors.END}")
-                        print(f"Usage: repos.py search <pattern>")
-                        return
-                elif args.command == 'graph':
-                    if args.package:
-                        view_graph(ecosystem, args.package)
-                    else:
-                        print(f"{Colors.RED}❌ Package name required for graph command{Colors.END}")
-                        print(f"Usage: repos.py graph <package-name>")
-                        return
-                elif args.command == 'learn':
-                    if args.package:
-                        if args.package.lower() == 'all':
-                            learn_all_opportunities(ecosystem)
-                        else:
-                            learn_package(ecosystem, args.package)
-                    else:
-                        print(f"{Colors.RED}❌ Package name or 'all' required for learn command{Colors.END}")
-                        print(f"Usage: repos.py learn <package-name>  # Learn a specific package")
-                        print(f"       repos.py learn all              # Learn all opportunities")
-                        return
-                elif args.command == 'notes':
-                    if args.package:
-                        view_repo_notes(ecosystem, args.package, create_if_missing=args.create)
-                    else:
-                        print(f"{Colors.RED}❌ Repository name required for notes command{Colors.END}")
-                        print(f"Usage: repos.py notes <repo-name>           # View hub metadata/notes")
-                        print(f"       repos.py notes <repo-name> --create  # Create metadata section if missing")
-                        return
+                if args.command in ECOSYSTEM_COMMANDS:
+                    ECOSYSTEM_COMMANDS[args.command](ecosystem)
+                else:
+                    handler(ecosystem, args)
             except Exception as e:
                 print(f"❌ Error in {args.command} command: {e}")
                 import traceback
@@ -6083,21 +6747,8 @@ EXAMPLES:
                 return
 
         # Utility commands
-        elif args.command == 'data':
-            generate_data_cache(dependencies, args.fast_mode)
-        elif args.command == 'export':
-            export_raw_data(dependencies)
-        elif args.command == 'superclean':
-            superclean_targets()
-        elif args.command == 'ls':
-            list_repositories(force_live=args.live)
-        elif args.command == 'legacy':
-            # Legacy analyze command for backwards compatibility
-            analyze_package_usage(dependencies)
-        elif args.command == 'fix-git':
-            fix_git_config(args)
-        elif args.command == 'scan-git':
-            scan_git_dependencies(args)
+        else:
+            UTILITY_COMMANDS[args.command](args)
 
     except KeyboardInterrupt:
         print(f"\n{Colors.YELLOW}⚠️  Operation interrupted by user{Colors.END}")
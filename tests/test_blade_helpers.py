@@ -0,0 +1,400 @@
+"""Tests for blade's pure helper functions."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import blade
+
+
+class TestAddGitFetchWithCli:
+    """Test the ~/.cargo/config.toml [net] edit used by fix-git."""
+
+    def test_existing_net_section(self):
+        """Test the setting is inserted under an existing [net] header."""
+        text, added = blade.add_git_fetch_with_cli("[net]\nretry = 2\n")
+        assert added
+        assert text == "[net]\ngit-fetch-with-cli = true\nretry = 2\n"
+
+    def test_net_header_with_comment(self):
+        """Test a trailing comment on the header still matches."""
+        text, added = blade.add_git_fetch_with_cli("[net]  # network\n")
+        assert added
+        assert blade.load_toml(text, is_string=True)['net']['git-fetch-with-cli'] is True
+
+    def test_crlf_config_no_duplicate_table(self):
+        """Test a CRLF [net] header is reused rather than declared twice."""
+        text, added = blade.add_git_fetch_with_cli("[net]\r\nretry = 2\r\n")
+        assert added
+        assert text == "[net]\r\ngit-fetch-with-cli = true\r\nretry = 2\r\n"
+        assert blade.load_toml(text, is_string=True)['net'] == {'git-fetch-with-cli': True, 'retry': 2}
+
+    def test_missing_net_section_appended(self):
+        """Test the section is appended when there is no [net] table."""
+        text, added = blade.add_git_fetch_with_cli("[build]\njobs = 4\n")
+        assert not added
+        assert blade.load_toml(text, is_string=True)['net']['git-fetch-with-cli'] is True
+
+    def test_other_tables_not_matched(self):
+        """Test [net.foo] and commented-out headers are not treated as [net]."""
+        assert not blade.CARGO_NET_SECTION_RE.search("[net.ssh]\n# [net]\n")
+
+
+class TestCategorizePackage:
+    """Test package domain categorization."""
+
+    NAMES = ["regex", "serde_json", "chrono", "reqwest", "libc", "env_logger",
+             "uuid", "tokio", "text-time", "serde-http", "os_info", "timer-rand"]
+
+    def test_keyword_priority(self, monkeypatch):
+        """Test the earliest domain in DOMAIN_KEYWORDS wins (fallback loop)."""
+        monkeypatch.setattr(blade, "DOMAIN_AUTOMATON", None)
+        assert blade.categorize_package("serde_json") == "data"
+        assert blade.categorize_package("env_logger") == "system"
+        assert blade.categorize_package("text-time") == "text"
+        assert blade.categorize_package("tokio") == "common"
+
+    def test_automaton_matches_fallback(self, monkeypatch):
+        """Test the Aho-Corasick path returns the same domain as the loop."""
+        pytest.importorskip("ahocorasick")
+        monkeypatch.setattr(blade, "DOMAIN_AUTOMATON", blade.build_domain_automaton())
+        with_automaton = [blade.categorize_package(name) for name in self.NAMES]
+        monkeypatch.setattr(blade, "DOMAIN_AUTOMATON", None)
+        fallback = [blade.categorize_package(name) for name in self.NAMES]
+        assert with_automaton == fallback
+
+
+class TestReadHubMetadata:
+    """Test reading [package.metadata.hub] from a Cargo.toml."""
+
+    def test_plain_table(self, tmp_path):
+        """Test the fast path for a plain table followed by another table."""
+        cargo = tmp_path / "Cargo.toml"
+        cargo.write_text('[package]\nname = "x"\n\n'
+                         '[package.metadata.hub]\nnotes = "hi"\npriority = "high"\n\n'
+                         '[dependencies]\nserde = "1"\n')
+        assert blade.read_hub_metadata(cargo) == {'notes': 'hi', 'priority': 'high'}
+
+    def test_crlf_table(self, tmp_path):
+        """Test a CRLF file still yields the table."""
+        cargo = tmp_path / "Cargo.toml"
+        cargo.write_bytes(b'[package]\r\nname = "x"\r\n[package.metadata.hub]\r\nhub_sync = "false"\r\n')
+        assert blade.read_hub_metadata(cargo) == {'hub_sync': 'false'}
+
+    def test_sub_table_falls_back_to_full_parse(self, tmp_path):
+        """Test sub-tables of the hub section are included via the full parse."""
+        cargo = tmp_path / "Cargo.toml"
+        cargo.write_text('[package]\nname = "x"\n[package.metadata.hub]\nnotes = "n"\n'
+                         '[package.metadata.hub.extra]\nk = 1\n')
+        assert blade.read_hub_metadata(cargo) == {'notes': 'n', 'extra': {'k': 1}}
+
+    def test_array_of_tables_falls_back_to_full_parse(self, tmp_path):
+        """Test [[package.metadata.hub.*]] entries are not dropped."""
+        cargo = tmp_path / "Cargo.toml"
+        cargo.write_text('[package]\nname = "x"\n[package.metadata.hub]\nnotes = "n"\n'
+                         '[dependencies]\nserde = "1"\n'
+                         '[[package.metadata.hub.links]]\nurl = "u"\n')
+        assert blade.read_hub_metadata(cargo) == {'notes': 'n', 'links': [{'url': 'u'}]}
+
+    def test_indented_next_header_ends_section(self, tmp_path):
+        """Test an indented header closes the hub table."""
+        cargo = tmp_path / "Cargo.toml"
+        cargo.write_text('[package]\nname = "x"\n[package.metadata.hub]\nnotes = "n"\n'
+                         '  [dependencies]\nserde = "1"\n')
+        assert blade.read_hub_metadata(cargo) == {'notes': 'n'}
+
+    def test_dotted_keys(self, tmp_path):
+        """Test metadata declared with dotted keys under [package]."""
+        cargo = tmp_path / "Cargo.toml"
+        cargo.write_text('[package]\nname = "x"\nmetadata.hub.notes = "dotted"\n')
+        assert blade.read_hub_metadata(cargo) == {'notes': 'dotted'}
+
+    def test_missing_section(self, tmp_path):
+        """Test a manifest without hub metadata returns an empty dict."""
+        cargo = tmp_path / "Cargo.toml"
+        cargo.write_text('[package]\nname = "x"\n')
+        assert blade.read_hub_metadata(cargo) == {}
+
+    def test_empty_file(self, tmp_path):
+        """Test an empty manifest (mmap can't map zero bytes)."""
+        cargo = tmp_path / "Cargo.toml"
+        cargo.write_text("")
+        assert blade.read_hub_metadata(cargo) == {}
+
+
+class TestGetSshMasterKey:
+    """Test which SSH URLs can reuse a shared git@ master."""
+
+    @pytest.mark.parametrize("url, key", [
+        ("ssh://git@github.com/org/repo.git", "github.com"),
+        ("git@qodeninja:org/repo.git", "qodeninja"),
+        ("ssh://git@example.com:2222/org/repo.git", None),
+        ("ssh://bob@example.com/org/repo.git", None),
+        ("https://github.com/org/repo.git", None),
+    ])
+    def test_keys(self, url, key):
+        """Test aliases are kept as typed and other users/ports get no master."""
+        assert blade.get_ssh_master_key(url) == key
+
+
+def _init_repo(path):
+    """Create a git repo with one commit and a local identity."""
+    for cmd in (['init', '-q'], ['config', 'user.name', 'Tap Test'],
+                ['config', 'user.email', 'tap@example.com'], ['config', 'commit.gpgsign', 'false']):
+        subprocess.run(['git', *cmd], cwd=path, check=True)
+    (path / "a.txt").write_text("a\n")
+    subprocess.run(['git', 'add', '.'], cwd=path, check=True)
+    subprocess.run(['git', 'commit', '-qm', 'init'], cwd=path, check=True)
+
+
+def _head_message(path):
+    return subprocess.run(['git', 'log', '-1', '--format=%s'], cwd=path,
+                          capture_output=True, text=True, check=True).stdout.strip()
+
+
+class TestTapCommitChanges:
+    """Test tap's commit step on the git CLI and pygit2 paths."""
+
+    def test_cli_path(self, tmp_path, monkeypatch):
+        """Test the git CLI fallback commits edits, new files and deletions."""
+        monkeypatch.setattr(blade, "load_pygit2", lambda: None)
+        _init_repo(tmp_path)
+        assert blade.tap_commit_changes(tmp_path, "tap") == "clean"
+        (tmp_path / "a.txt").unlink()
+        (tmp_path / "b.txt").write_text("b\n")
+        assert blade.tap_commit_changes(tmp_path, "tap") == "committed"
+        assert _head_message(tmp_path) == "tap"
+        assert blade.tap_commit_changes(tmp_path, "tap") == "clean"
+
+    def test_pygit2_path(self, tmp_path):
+        """Test the in-process commit stages edits, new files and deletions."""
+        pytest.importorskip("pygit2")
+        _init_repo(tmp_path)
+        (tmp_path / "a.txt").unlink()
+        (tmp_path / "b.txt").write_text("b\n")
+        assert blade._tap_commit_pygit2(tmp_path, "tap") == "committed"
+        assert _head_message(tmp_path) == "tap"
+        status = subprocess.run(['git', 'status', '--porcelain'], cwd=tmp_path,
+                                capture_output=True, text=True, check=True).stdout
+        assert status == ""
+
+    def test_pygit2_defers_to_cli_for_hooks(self, tmp_path):
+        """Test repos with a commit hook are left to the git CLI."""
+        pytest.importorskip("pygit2")
+        _init_repo(tmp_path)
+        hook = tmp_path / ".git" / "hooks" / "pre-commit"
+        hook.write_text("#!/bin/sh\ntouch hook-ran\n")
+        hook.chmod(0o755)
+        (tmp_path / "b.txt").write_text("b\n")
+        assert blade._tap_commit_pygit2(tmp_path, "tap") is None
+        assert blade.tap_commit_changes(tmp_path, "tap") == "committed"
+        assert (tmp_path / "hook-ran").exists()
+
+
+class TestGetGitUrlHost:
+    """Test host extraction from git URLs."""
+
+    @pytest.mark.parametrize("url, host", [
+        ("https://github.com/org/repo.git", "github.com"),
+        ("ssh://git@gitlab.com/org/repo.git", "gitlab.com"),
+        ("ssh://git@example.com:2222/org/repo.git", "example.com"),
+        ("git@github.com:org/repo.git", "github.com"),
+        ("https://user@host.example/repo", "host.example"),
+        ("file:///tmp/repo", ""),
+    ])
+    def test_hosts(self, url, host):
+        """Test https, ssh, scp-style and file URLs."""
+        assert blade.get_git_url_host(url) == host
+
+
+class TestGitProbeCache:
+    """Test loading and saving the scan-git probe cache."""
+
+    def test_malformed_and_stale_entries_dropped(self, tmp_path, monkeypatch):
+        """Test bad entries are cache misses instead of raising KeyError."""
+        cache_path = tmp_path / "git_probe.json"
+        monkeypatch.setattr(blade, "get_git_probe_cache_path", lambda: str(cache_path))
+        cache_path.write_text(json.dumps({
+            "ok": {"returncode": 0, "stderr": "", "ts": 1000},
+            "missing-keys": {"returncode": 0},
+            "not-a-dict": 5,
+            "stale": {"returncode": 128, "stderr": "not found", "ts": 1000 - blade.GIT_PROBE_CACHE_TTL_FAILED},
+        }))
+        assert list(blade.load_git_probe_cache(now=1001)) == ["ok"]
+
+    def test_non_mapping_file(self, tmp_path, monkeypatch):
+        """Test a cache file that isn't a JSON object is ignored."""
+        cache_path = tmp_path / "git_probe.json"
+        monkeypatch.setattr(blade, "get_git_probe_cache_path", lambda: str(cache_path))
+        cache_path.write_text("[1, 2]")
+        assert blade.load_git_probe_cache() == {}
+
+    def test_save_round_trip_leaves_no_temp_file(self, tmp_path, monkeypatch):
+        """Test saving replaces the cache atomically without leftovers."""
+        cache_path = tmp_path / "git_probe.json"
+        monkeypatch.setattr(blade, "get_git_probe_cache_path", lambda: str(cache_path))
+        entry = {"returncode": 0, "stderr": "", "ts": 1000}
+        blade.save_git_probe_cache({"url": entry})
+        assert blade.load_git_probe_cache(now=1001) == {"url": entry}
+        assert [p.name for p in tmp_path.iterdir()] == ["git_probe.json"]
+
+
+class TestParseCargoCleanFreedBytes:
+    """Test parsing cargo clean's summary line."""
+
+    def test_binary_units(self):
+        """Test KiB/MiB/GiB summaries."""
+        assert blade.parse_cargo_clean_freed_bytes("     Removed 12 files, 1.5GiB total") == int(1.5 * 1024 ** 3)
+        assert blade.parse_cargo_clean_freed_bytes("Removed 1 file, 512KiB total") == 512 * 1024
+
+    def test_plain_bytes(self):
+        """Test a summary reported in bytes."""
+        assert blade.parse_cargo_clean_freed_bytes("Removed 3 files, 900B total") == 900
+
+    def test_summary_without_total(self):
+        """Test nothing-to-free summaries count as 0 bytes, not a missing summary."""
+        assert blade.parse_cargo_clean_freed_bytes("     Removed 0 files") == 0
+        assert blade.parse_cargo_clean_freed_bytes("     Removed 1 directory") == 0
+        assert blade.parse_cargo_clean_freed_bytes("Removed 2 directories") == 0
+
+    def test_no_summary(self):
+        """Test output without a Removed line (older cargo)."""
+        assert blade.parse_cargo_clean_freed_bytes("") is None
+        assert blade.parse_cargo_clean_freed_bytes("warning: something else") is None
+
+
+class TestIterCargoFiles:
+    """Test Cargo.toml discovery with exact-name directory pruning."""
+
+    def test_excluded_dirs_pruned_by_exact_name(self, tmp_path):
+        """Test target/.git/nested excluded dirs are skipped but look-alikes are not."""
+        for rel in ["Cargo.toml",
+                    "crate/Cargo.toml",
+                    "crate/target/debug/Cargo.toml",
+                    ".git/Cargo.toml",
+                    "nested/deep/archive/Cargo.toml",
+                    "nested/deep/node_modules/pkg/Cargo.toml",
+                    "devtools/Cargo.toml",
+                    "targets/Cargo.toml",
+                    "my-dev/Cargo.toml"]:
+            path = tmp_path / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("")
+        found = {p.relative_to(tmp_path).as_posix() for p in blade.iter_cargo_files(tmp_path)}
+        assert found == {"Cargo.toml", "crate/Cargo.toml", "devtools/Cargo.toml",
+                         "targets/Cargo.toml", "my-dev/Cargo.toml"}
+
+    def test_missing_root(self, tmp_path):
+        """Test an unreadable or missing root yields nothing."""
+        assert list(blade.iter_cargo_files(tmp_path / "missing")) == []
+
+
+class TestConvertHttpsGitUrlsToSsh:
+    """Test the fix-urls HTTPS -> SSH rewrite."""
+
+    MANIFEST = ('[dependencies]\n'
+                'a = { git = "https://github.com/org/a.git" }\n'
+                'b = { git = "https://gitlab.com/org/b.git", branch = "main" }\n'
+                'c = { git = "https://example.com/org/c.git" }\n'
+                'd = { git = "ssh://git@github.com/org/d.git" }\n')
+
+    def test_rewrites_github_and_gitlab_only(self, tmp_path):
+        """Test forge HTTPS URLs become ssh://git@ and others are untouched."""
+        cargo = tmp_path / "Cargo.toml"
+        cargo.write_text(self.MANIFEST)
+        assert blade.convert_https_git_urls_to_ssh(cargo) is True
+        assert cargo.read_text() == self.MANIFEST.replace(
+            "https://github.com/", "ssh://git@github.com/").replace(
+            "https://gitlab.com/", "ssh://git@gitlab.com/")
+
+    def test_dry_run_leaves_file(self, tmp_path):
+        """Test dry runs report a match without writing."""
+        cargo = tmp_path / "Cargo.toml"
+        cargo.write_text(self.MANIFEST)
+        assert blade.convert_https_git_urls_to_ssh(cargo, dry_run=True) is True
+        assert cargo.read_text() == self.MANIFEST
+
+    def test_no_match_not_written(self, tmp_path):
+        """Test files without forge HTTPS URLs are neither matched nor rewritten."""
+        cargo = tmp_path / "Cargo.toml"
+        cargo.write_text('[dependencies]\nserde = "1"\n')
+        mtime = cargo.stat().st_mtime_ns
+        assert blade.convert_https_git_urls_to_ssh(cargo) is False
+        assert cargo.stat().st_mtime_ns == mtime
+
+    def test_empty_file(self, tmp_path):
+        """Test an empty manifest (mmap can't map zero bytes)."""
+        cargo = tmp_path / "Cargo.toml"
+        cargo.write_text("")
+        assert blade.convert_https_git_urls_to_ssh(cargo) is False
+
+    def test_crlf_preserved(self, tmp_path):
+        """Test the bytes rewrite keeps CRLF line endings."""
+        cargo = tmp_path / "Cargo.toml"
+        cargo.write_bytes(b'[dependencies]\r\na = { git = "https://github.com/o/a" }\r\n')
+        assert blade.convert_https_git_urls_to_ssh(cargo) is True
+        assert cargo.read_bytes() == b'[dependencies]\r\na = { git = "ssh://git@github.com/o/a" }\r\n'
+
+
+def _ecosystem(**packages):
+    """Minimal stand-in for EcosystemData.latest entries used by learn."""
+    return SimpleNamespace(latest={
+        name: SimpleNamespace(hub_status=status, latest_stable_version=stable, latest_version=latest)
+        for name, (status, stable, latest) in packages.items()
+    })
+
+
+class TestLearnPackages:
+    """Test learning packages into hub's Cargo.toml."""
+
+    ECOSYSTEM = _ecosystem(
+        regex=('gap', '1.10.0', '1.11.0-rc1'),
+        rand=(None, None, '0.8.5'),
+        serde=('current', '1.0.0', '1.0.0'),
+        rsb=(None, '0.1.0', '0.1.0'),
+    )
+
+    def test_get_learn_target(self):
+        """Test validation: rsb, unknown and already-in-hub packages are refused."""
+        assert blade.get_learn_target(self.ECOSYSTEM, 'regex') == ('1.10.0', 'text')
+        assert blade.get_learn_target(self.ECOSYSTEM, 'rand') == ('0.8.5', 'random')
+        assert blade.get_learn_target(self.ECOSYSTEM, 'serde') is None
+        assert blade.get_learn_target(self.ECOSYSTEM, 'rsb') is None
+        assert blade.get_learn_target(self.ECOSYSTEM, 'missing') is None
+
+    def test_add_package_to_hub_data(self):
+        """Test the dependency and feature wiring added to parsed hub data."""
+        data = {'features': {'text': ['unicode-width']}}
+        blade.add_package_to_hub_data(data, 'regex', '1.10.0', 'text')
+        blade.add_package_to_hub_data(data, 'regex', '1.10.0', 'text')
+        assert data['dependencies'] == {'regex': {'version': '1.10.0', 'optional': True}}
+        assert data['features'] == {'text': ['unicode-width', 'regex'], 'regex': ['dep:regex']}
+
+    def test_learn_several_in_one_write(self, tmp_path, monkeypatch):
+        """Test every learnable package lands in hub's Cargo.toml and the rest are skipped."""
+        (tmp_path / "Cargo.toml").write_text(
+            '[package]\nname = "hub"\n\n[dependencies]\nserde = "1"\n\n[features]\ndefault = []\n')
+        monkeypatch.setattr(blade, "HUB_PATH", str(tmp_path))
+        learned = blade.learn_packages(self.ECOSYSTEM, ['regex', 'rand', 'serde', 'rsb', 'missing'])
+        assert learned == 2
+        hub = blade.load_toml(tmp_path / "Cargo.toml")
+        assert hub['dependencies']['serde'] == '1'
+        assert hub['dependencies']['regex'] == {'version': '1.10.0', 'optional': True}
+        assert hub['dependencies']['rand'] == {'version': '0.8.5', 'optional': True}
+        assert hub['features']['regex'] == ['dep:regex']
+        assert hub['features']['rand'] == ['dep:rand']
+
+    def test_nothing_to_learn_leaves_hub(self, tmp_path, monkeypatch):
+        """Test no write happens when no package can be learned."""
+        cargo = tmp_path / "Cargo.toml"
+        cargo.write_text('[package]\nname = "hub"\n')
+        monkeypatch.setattr(blade, "HUB_PATH", str(tmp_path))
+        assert blade.learn_packages(self.ECOSYSTEM, ['serde', 'rsb']) == 0
+        assert cargo.read_text() == '[package]\nname = "hub"\n'
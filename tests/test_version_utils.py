@@ -1,4 +1,4 @@
-"""Tests for version_utils module."""
+"""Tests for blade's version utilities (formerly the version_utils module)."""
 
 import pytest
 import sys
@@ -7,7 +7,7 @@ from pathlib import Path
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-import version_utils
+import blade as version_utils
 from packaging import version as pkg_version
 
 
@@ -71,6 +71,52 @@ class TestCanonicalizeVersion:
         assert ver is not None
         assert ver.major == 1
 
+    def test_repeated_parse_is_cached(self):
+        """Test that repeated strings reuse the cached Version object."""
+        version_utils.canonicalize_version.cache_clear()
+        ver1 = version_utils.canonicalize_version("1.2.3")
+        ver2 = version_utils.canonicalize_version("1.2.3")
+        assert ver1 is ver2
+        assert version_utils.canonicalize_version.cache_info().hits == 1
+
+    def test_equivalent_spellings_share_object(self):
+        """Test that spellings normalizing to the same version are interned."""
+        ver1 = version_utils.canonicalize_version("1.4.0")
+        ver2 = version_utils.canonicalize_version("=1.4.0")
+        ver3 = version_utils.canonicalize_version('"1.4.0"')
+        assert ver1 is ver2 is ver3
+
+    def test_intern_table_is_bounded(self, monkeypatch):
+        """Test the intern table never outgrows the cache size and clears with it."""
+        monkeypatch.setattr(version_utils, "VERSION_CACHE_SIZE", 4)
+        version_utils.canonicalize_version.cache_clear()
+        for minor in range(10):
+            version_utils.canonicalize_version(f"9.{minor}.0")
+        assert 0 < len(version_utils._interned_versions) <= 4
+        version_utils.canonicalize_version.cache_clear()
+        assert version_utils._interned_versions == {}
+
+    def test_first_token_split_on_any_whitespace(self):
+        """Test that trailing text after a tab or space is dropped."""
+        assert version_utils.canonicalize_version("1.0\tx") == pkg_version.parse("1.0")
+        assert version_utils.canonicalize_version("1.0 x") == pkg_version.parse("1.0")
+
+    def test_single_prefix_stripped(self):
+        """Test one leading '=' and/or 'v' is accepted."""
+        for spelling in ("=1.0", "v1.0", "=v1.0", '"=1.0"'):
+            assert version_utils.canonicalize_version(spelling) == pkg_version.parse("1.0")
+
+    def test_repeated_or_detached_prefix_rejected(self):
+        """Test doubled, reordered or space-separated prefixes don't parse."""
+        for spelling in ("vv1.0", "==1.0", "v=1.0", "= 1.0"):
+            assert version_utils.canonicalize_version(spelling) is None
+            assert version_utils.parse_version_metadata(spelling)['version'] is None
+
+    def test_version_object_passes_through(self):
+        """Test that Version objects are returned unchanged."""
+        ver = pkg_version.parse("1.2.3")
+        assert version_utils.canonicalize_version(ver) is ver
+
 
 class TestIsPrerelease:
     """Test pre-release detection."""
@@ -149,6 +195,29 @@ class TestFilterPrerelease:
         assert len(result) == 2
 
 
+class TestCanonicalizeVersions:
+    """Test batch canonicalization."""
+
+    def test_parallel_lists(self):
+        """Test that parsed versions and pre-release flags line up by index."""
+        parsed, is_pre = version_utils.canonicalize_versions(
+            ["1.0.0", "2.0.0-rc1", "invalid", pkg_version.parse("3.0")])
+        assert parsed[0] == pkg_version.parse("1.0.0")
+        assert parsed[2] is None
+        assert parsed[3] == pkg_version.parse("3.0")
+        assert is_pre == [False, True, False, False]
+
+    def test_empty_input(self):
+        """Test batch canonicalization of an empty list."""
+        assert version_utils.canonicalize_versions([]) == ([], [])
+
+    def test_non_string_values_coerced(self):
+        """Test that non-str values are coerced like canonicalize_version does."""
+        parsed, is_pre = version_utils.canonicalize_versions([2, None])
+        assert parsed == [pkg_version.parse("2"), None]
+        assert is_pre == [False, False]
+
+
 class TestGetLatestStable:
     """Test getting latest stable version."""
 
@@ -179,6 +248,22 @@ class TestGetLatestStable:
         result = version_utils.get_latest_stable([])
         assert result is None
 
+    def test_bulk(self):
+        """Test resolving several version lists at once."""
+        result = version_utils.get_latest_stable_bulk([
+            ["1.0.0", "2.0.0-rc1", "1.5.0"],
+            ["1.0.0-alpha"],
+            [],
+        ])
+        assert [str(v) if v else None for v in result] == ["1.5.0", None, None]
+
+    def test_top_n_stable(self):
+        """Test top-N query skips pre-releases and returns newest first."""
+        versions = ["1.0.0", "3.0.0-rc1", "2.0.0", "1.5.0", "0.9"]
+        result = version_utils.top_n_stable(versions, 2)
+        assert [str(v) for v in result] == ["2.0.0", "1.5.0"]
+        assert version_utils.top_n_stable(["1.0.0-alpha"], 3) == []
+
 
 class TestVersionsEqual:
     """Test version equality."""